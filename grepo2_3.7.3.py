@@ -7,30 +7,45 @@ Erweitert um autonome Code-Generierung mit Codex CLI und OpenRouter Integration.
 Version 3.7.3 - Mit automatischem Issue-Closing und CHANGELOG.md Integration
 """
 
+from __future__ import annotations
+
 import sys
 import subprocess
 import json
 import os
 import base64
-import curses
+import importlib.util
 import textwrap
 import shutil
 import time
-import requests
+import random
 import re
-import filecmp
+import functools
+import itertools
+import hmac
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple, Any, Optional, Callable, Dict
+from typing import List, Tuple, Any, Optional, Callable, Dict, Iterator, TYPE_CHECKING
 from getpass import getpass
 
+if TYPE_CHECKING:
+    import requests
+
+# orjson (optional) parst große GitHub-Antworten deutlich schneller
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# rich und curses werden erst in den TUI-Pfaden importiert, damit schnelle
+# CLI-Befehle wie `status` und `logout` ohne deren Import-Kosten auskommen.
 try:
     import click
-    from rich.console import Console
-    from rich.table import Table
-    from rich.markdown import Markdown
-    from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn
+    if importlib.util.find_spec("rich") is None:
+        raise ImportError("rich")
 except ImportError:
     print("❌ Fehler: Notwendige Python-Pakete (rich, click) nicht gefunden.", file=sys.stderr)
     print("   Bitte installieren Sie diese mit: pip install rich click", file=sys.stderr)
@@ -39,6 +54,7 @@ except ImportError:
 
 # ─── Section I: Pre-flight & Config ────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=None)
 def check_git_cli() -> bool:
     try:
         subprocess.run(["git", "--version"], check=True, capture_output=True)
@@ -48,8 +64,9 @@ def check_git_cli() -> bool:
         print("   Bitte installieren Sie Git für Dein Betriebssystem.", file=sys.stderr)
         return False
 
+@functools.lru_cache(maxsize=None)
 def check_codex_cli() -> bool:
-    """Prüft ob Codex CLI installiert ist, installiert es falls nötig"""
+    """Prüft ob Codex CLI installiert ist, installiert es falls nötig (Ergebnis gilt für die Prozesslaufzeit)"""
     try:
         result = subprocess.run(["codex", "--version"], check=True, capture_output=True, text=True)
         console.print(f"[green]✓ Codex CLI gefunden: {result.stdout.strip()}[/green]")
@@ -70,6 +87,8 @@ USERS_DIR   = CONFIG_DIR  / "users"
 GITHUB_DIR  = Path.home()  / "github2"
 CONFIG_FILE = CONFIG_DIR   / "config.json"
 CODEX_DIR   = Path.home()  / ".codex"
+CACHE_DIR   = CONFIG_DIR   / "cache"
+RATELIMIT_DIR = CONFIG_DIR / "ratelimit"
 for p in (CONFIG_DIR, USERS_DIR, GITHUB_DIR, CODEX_DIR):
     p.mkdir(parents=True, exist_ok=True)
 
@@ -91,10 +110,12 @@ def get_main_config() -> Dict[str, Any]:
 def save_main_config(cfg: Dict[str, Any]):
     with open(CONFIG_FILE, 'w') as f:
         json.dump(cfg, f, indent=2)
+    get_active_user.cache_clear()
 
 
 # ─── Section II: Multi-User Config ─────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def get_active_user() -> Optional[str]:
     return get_main_config().get("active_user")
 
@@ -104,10 +125,9 @@ def set_active_user(username: str):
     cfg['last_repo_path'] = None
     save_main_config(cfg)
 
-def load_user_config(username: str) -> Optional[Dict[str, Any]]:
+@functools.lru_cache(maxsize=32)
+def _load_user_config_cached(username: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
     uf = USERS_DIR / f"{username}.json"
-    if not uf.exists():
-        return None
     with open(uf, 'r') as f:
         try:
             data = json.load(f)
@@ -117,11 +137,21 @@ def load_user_config(username: str) -> Optional[Dict[str, Any]]:
         except (json.JSONDecodeError, KeyError):
             return None
 
+def load_user_config(username: str) -> Optional[Dict[str, Any]]:
+    """Lädt die Benutzer-Konfiguration; gecacht, solange sich die mtime der Datei nicht ändert"""
+    try:
+        mtime_ns = (USERS_DIR / f"{username}.json").stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    data = _load_user_config_cached(username, mtime_ns)
+    return dict(data) if data is not None else None
+
 def save_user_config(username: str, token: str):
     uf = USERS_DIR / f"{username}.json"
     data = {"username": username, "token": _obfuscate(token)}
     with open(uf, 'w') as f:
         json.dump(data, f, indent=2)
+    _load_user_config_cached.cache_clear()
 
 def update_user_config(username: str,
                        token: Optional[str] = None,
@@ -144,18 +174,54 @@ def update_user_config(username: str,
         data["model"] = model
     with open(uf, 'w') as f:
         json.dump(data, f, indent=2)
+    _load_user_config_cached.cache_clear()
+
+def _scan_user_files() -> List[Tuple[str, str]]:
+    """Ein einziger Verzeichnis-Durchlauf über USERS_DIR: (Benutzername, Pfad)"""
+    with os.scandir(USERS_DIR) as it:
+        return sorted((e.name[:-5], e.path) for e in it
+                      if e.name.endswith(".json") and e.is_file())
 
 def get_all_users() -> List[str]:
-    return sorted(p.stem for p in USERS_DIR.glob("*.json"))
+    return [name for name, _ in _scan_user_files()]
+
+def load_all_user_configs(decode_tokens: bool = True) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Lädt alle Benutzer-Konfigurationen mit einem Verzeichnis-Scan (None bei defekten Dateien).
+    Übersichten, die den GitHub-Token nicht brauchen, können das Dekodieren abschalten."""
+    configs: Dict[str, Optional[Dict[str, Any]]] = {}
+    for name, path in _scan_user_files():
+        try:
+            data = json.loads(Path(path).read_bytes())
+            if decode_tokens and "token" in data:
+                data["token"] = _deobfuscate(data["token"])
+        except (json.JSONDecodeError, KeyError):
+            data = None
+        configs[name] = data
+    return configs
 
 def delete_user_config(username: str):
     uf = USERS_DIR / f"{username}.json"
     if uf.exists():
         uf.unlink()
+    _load_user_config_cached.cache_clear()
+
 
+# Console-Objekt initialisieren (lazy, Rich wird erst beim ersten Zugriff geladen)
+class _LazyConsole:
+    _console = None
 
-# Console-Objekt initialisieren
-console = Console()
+    def __getattr__(self, name):
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
+console = _LazyConsole()
+
+def _spinner():
+    """Erstellt einen Rich-Progress-Spinner für laufende Operationen"""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    return Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"))
 
 
 # ─── Section III: CHANGELOG Management ──────────────────────────────────────────
@@ -206,51 +272,223 @@ def write_to_changelog(repo_path: Path, message: str, log_type: str = "info"):
 
 # ─── Section IV: GitHub API ─────────────────────────────────────────────────────
 
+class TokenBucket:
+    """Clientseitiger Token-Bucket für GitHub-Requests, Zustand wird zwischen CLI-Aufrufen persistiert"""
+
+    def __init__(self, state_file: Path, capacity: float = 5000, refill_rate: float = 5000 / 3600):
+        self.state_file = state_file
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+
+    def _load(self) -> Tuple[float, float]:
+        try:
+            state = json.loads(self.state_file.read_text())
+            return float(state["tokens"]), float(state["last_refill_ts"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return self.capacity, time.time()
+
+    def _save(self, tokens: float, ts: float):
+        tmp = self.state_file.with_suffix(".json.tmp")
+        try:
+            tmp.write_text(json.dumps({"tokens": tokens, "last_refill_ts": ts}))
+            os.replace(tmp, self.state_file)
+        except OSError:
+            pass
+
+    def acquire(self, n: int = 1):
+        tokens, last = self._load()
+        now = time.time()
+        tokens = min(self.capacity, tokens + (now - last) * self.refill_rate)
+        if tokens < n:
+            wait = (n - tokens) / self.refill_rate
+            time.sleep(wait)
+            now += wait
+            tokens = n
+        self._save(tokens - n, now)
+
+    def update_from_headers(self, headers: Dict[str, str]):
+        """Gleicht den lokalen Zustand an X-RateLimit-Remaining des Servers an (nur REST-Kontingent `core`)"""
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None or headers.get("X-RateLimit-Resource", "core") != "core":
+            return
+        try:
+            self._save(min(self.capacity, float(remaining)), time.time())
+        except ValueError:
+            pass
+
+def _rate_limiter(token: str) -> TokenBucket:
+    """Token-Bucket pro GitHub-Token – jedes Konto hat sein eigenes Kontingent"""
+    key = hashlib.sha256(token.encode()).hexdigest()[:16]
+    RATELIMIT_DIR.mkdir(parents=True, exist_ok=True)
+    return TokenBucket(RATELIMIT_DIR / f"{key}.json")
+
+def _server_delay(resp: requests.Response) -> Optional[float]:
+    """Wartezeit aus Retry-After bzw. X-RateLimit-Reset (None, falls nicht angegeben)"""
+    try:
+        if "Retry-After" in resp.headers:
+            return float(resp.headers["Retry-After"])
+        if resp.headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in resp.headers:
+            return max(0.0, int(resp.headers["X-RateLimit-Reset"]) - time.time())
+    except ValueError:
+        pass
+    return None
+
+def _retry(fn: Callable[[], requests.Response], n_max: int = 3, base: float = 1.0,
+           cap: float = 30.0, jitter: float = 0.5, idempotent: bool = True) -> requests.Response:
+    """Wiederholt einen Request bei Netzwerkfehlern, Rate-Limits (403/429) und 5xx
+    mit exponentiellem Backoff und Jitter. Verlangt der Server eine längere Pause
+    als `cap`, wird die Antwort direkt zurückgegeben statt zu blockieren.
+    Nicht-idempotente Requests (`idempotent=False`, z.B. POST) werden nur bei
+    Rate-Limits wiederholt – dort ist sicher, dass der Server nichts ausgeführt hat."""
+    import requests
+    for attempt in range(n_max + 1):
+        try:
+            resp = fn()
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == n_max or not idempotent:
+                raise
+            resp = None
+
+        delay = min(cap, base * 2 ** attempt) * (1 + random.uniform(0, jitter))
+        if resp is not None:
+            server_delay = _server_delay(resp) if resp.status_code in (403, 429) else None
+            retryable = (resp.status_code == 429 or server_delay is not None
+                         or (idempotent and resp.status_code >= 500))
+            if not retryable or attempt == n_max:
+                return resp
+            if server_delay is not None:
+                if server_delay > cap:
+                    return resp
+                delay = server_delay
+        time.sleep(delay)
+    raise AssertionError("unreachable")
+
 class GitHubAPI:
     def __init__(self, token: str):
+        # requests erst hier importieren: lokale Befehle wie `status` brauchen es nicht
+        import requests
         self.token = token
+        self.rate_limiter = _rate_limiter(token)
         self.session = requests.Session()
-        self.session.headers.update({"Authorization": f"token {token}"})
+        adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github+json"
+        })
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Request über das clientseitige Rate-Limit (GraphQL hat ein eigenes Punkte-Kontingent)"""
+        rest = not url.endswith("/graphql")
+        if rest:
+            self.rate_limiter.acquire()
+        resp = self.session.request(method, url, **kwargs)
+        if rest:
+            self.rate_limiter.update_from_headers(resp.headers)
+        return resp
 
     def get_user_info(self) -> Tuple[bool, Optional[Dict[str, Any]]]:
         try:
             resp = self.session.get("https://api.github.com/user", timeout=10)
             if resp.status_code == 200:
-                return True, resp.json()
+                return True, _loads(resp.content)
             else:
                 return False, None
         except Exception:
             return False, None
 
-    def list_repositories(self, username: str) -> List[Dict[str, Any]]:
-        repos = []
-        page = 1
-        while True:
-            try:
-                resp = self.session.get(
-                    f"https://api.github.com/users/{username}/repos",
-                    params={"page": page, "per_page": 100, "sort": "updated"},
-                    timeout=10
-                )
-                if resp.status_code != 200:
-                    break
-                data = resp.json()
-                if not data:
-                    break
-                repos.extend(data)
+    def _fetch_repo_page(self, username: str, page: int,
+                         cached: Optional[Dict[str, Any]]) -> Optional[Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]], Optional[int]]]:
+        """Holt eine Repo-Seite (per ETag revalidiert): (Daten, Cache-Eintrag, letzte Seite laut Link-Header)"""
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+        try:
+            resp = self.session.get(
+                f"https://api.github.com/users/{username}/repos",
+                params={"page": page, "per_page": 100, "sort": "updated"},
+                headers=headers,
+                timeout=10
+            )
+            if resp.status_code == 304 and cached:
+                return cached["body"], cached, cached.get("last")
+            if resp.status_code != 200:
+                return None
+            data = _loads(resp.content)
+        except Exception:
+            return None
+
+        last = None
+        match = re.search(r"[?&]page=(\d+)", resp.links.get("last", {}).get("url", ""))
+        if match:
+            last = int(match.group(1))
+        etag = resp.headers.get("ETag")
+        entry = {"etag": etag, "body": data, "last": last} if etag else None
+        return data, entry, last
+
+    def iter_repository_pages(self, username: str) -> Iterator[List[Dict[str, Any]]]:
+        """Liefert die Repository-Seiten in Reihenfolge, sobald sie verfügbar sind.
+        Seiten werden per ETag gecacht (304-Antworten zählen nicht gegen das Rate-Limit);
+        ist die Seitenzahl über den Link-Header bekannt, werden die Folgeseiten parallel geladen."""
+        cache_file = CACHE_DIR / username / "repos.json"
+        try:
+            cache = json.loads(cache_file.read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError):
+            cache = {}
+        new_cache = {}
+
+        def fetch(page: int):
+            return self._fetch_repo_page(username, page, cache.get(str(page)))
+
+        first = fetch(1)
+        if first is None:
+            return
+        data, entry, last = first
+        if entry:
+            new_cache["1"] = entry
+        yield data
+
+        if last is not None:
+            if last > 1:
+                with ThreadPoolExecutor(max_workers=min(10, last - 1)) as executor:
+                    for page, result in enumerate(executor.map(fetch, range(2, last + 1)), 2):
+                        if result is None:
+                            break
+                        data, entry, _ = result
+                        if entry:
+                            new_cache[str(page)] = entry
+                        yield data
+        else:
+            # Kein Link-Header: sequenziell weiterblättern, solange Seiten voll sind
+            page = 1
+            while len(data) >= 100:
                 page += 1
-            except Exception:
-                break
-        return repos
+                result = fetch(page)
+                if result is None:
+                    break
+                data, entry, _ = result
+                if entry:
+                    new_cache[str(page)] = entry
+                yield data
+
+        if new_cache and new_cache != cache:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps(new_cache), encoding='utf-8')
+            except OSError:
+                pass
+
+    def list_repositories(self, username: str) -> List[Dict[str, Any]]:
+        return [repo for page in self.iter_repository_pages(username) for repo in page]
 
     def get_repository_details(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
         try:
             resp = self.session.get(f"https://api.github.com/repos/{owner}/{repo}", timeout=10)
-            return resp.json() if resp.status_code == 200 else None
+            return _loads(resp.content) if resp.status_code == 200 else None
         except Exception:
             return None
 
     def create_repository(self, repo_name: str, description: str = "", private: bool = True) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Erstellt ein Repository. Die 201-Antwort enthält bereits das vollständige
+        Repository-Objekt (html_url, clone_url, ...) – ein Folge-GET ist nicht nötig."""
         payload = {
             "name": repo_name,
             "description": description,
@@ -258,21 +496,46 @@ class GitHubAPI:
             "auto_init": True
         }
         try:
-            resp = self.session.post("https://api.github.com/user/repos", json=payload, timeout=10)
+            resp = _retry(lambda: self._request("POST", "https://api.github.com/user/repos", json=payload, timeout=10),
+                          idempotent=False)
             if resp.status_code == 201:
-                return True, resp.json()
+                return True, _loads(resp.content)
             else:
-                return False, resp.json() if resp.text else None
+                return False, _loads(resp.content) if resp.content else None
         except Exception:
             return False, None
 
     def delete_repository(self, owner: str, repo: str) -> bool:
         try:
-            resp = self.session.delete(f"https://api.github.com/repos/{owner}/{repo}", timeout=10)
+            resp = _retry(lambda: self._request("DELETE", f"https://api.github.com/repos/{owner}/{repo}", timeout=10))
             return resp.status_code == 204
         except Exception:
             return False
 
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Führt eine GraphQL-Abfrage aus und liefert den `data`-Teil (None bei Fehlern)"""
+        try:
+            resp = self._request("POST", "https://api.github.com/graphql",
+                                 json={"query": query, "variables": variables or {}}, timeout=10)
+            return _loads(resp.content).get("data") if resp.status_code == 200 else None
+        except Exception:
+            return None
+
+    def repositories_exist(self, owner: str, names: List[str]) -> Optional[Dict[str, bool]]:
+        """Prüft per GraphQL (max. 100 Aliase pro Abfrage), welche Repositories existieren"""
+        result = {}
+        for start in range(0, len(names), 100):
+            chunk = names[start:start + 100]
+            params = ", ".join(f"$n{i}: String!" for i in range(len(chunk)))
+            fields = " ".join(f"r{i}: repository(owner: $owner, name: $n{i}) {{ id }}" for i in range(len(chunk)))
+            variables = {"owner": owner, **{f"n{i}": name for i, name in enumerate(chunk)}}
+            data = self.graphql(f"query($owner: String!, {params}) {{ {fields} }}", variables)
+            if data is None:
+                return None
+            for i, name in enumerate(chunk):
+                result[name] = data.get(f"r{i}") is not None
+        return result
+
     def get_issues(self, owner: str, repo: str, state: str = "open") -> List[Dict[str, Any]]:
         """Holt Issues eines Repositories"""
         try:
@@ -281,7 +544,7 @@ class GitHubAPI:
                 params={"state": state, "per_page": 100},
                 timeout=10
             )
-            return resp.json() if resp.status_code == 200 else []
+            return _loads(resp.content) if resp.status_code == 200 else []
         except Exception:
             return []
 
@@ -292,7 +555,7 @@ class GitHubAPI:
                 f"https://api.github.com/repos/{owner}/{repo}/issues/{issue_number}/comments",
                 timeout=10
             )
-            return resp.json() if resp.status_code == 200 else []
+            return _loads(resp.content) if resp.status_code == 200 else []
         except Exception:
             return []
 
@@ -332,11 +595,21 @@ class GitHubAPI:
                 f"https://api.github.com/repos/{owner}/{repo}/contents/{path}",
                 timeout=10
             )
-            return resp.json() if resp.status_code == 200 else []
+            return _loads(resp.content) if resp.status_code == 200 else []
         except Exception:
             return []
 
 
+_github_api_cache: Dict[str, GitHubAPI] = {}
+
+def get_github_api(token: str) -> GitHubAPI:
+    """Liefert einen GitHubAPI-Client pro Token, damit dessen Verbindungspool wiederverwendet wird"""
+    api = _github_api_cache.get(token)
+    if api is None:
+        api = _github_api_cache[token] = GitHubAPI(token)
+    return api
+
+
 # ─── Section V: Local Git API ───────────────────────────────────────────────────
 
 class LocalGitAPI:
@@ -448,6 +721,7 @@ class CodexIntegration:
     def __init__(self, openrouter_token: str, model: str = "openai/gpt-4o"):
         self.openrouter_token = openrouter_token
         self.model = model
+        import requests
         self.session = requests.Session()
         self.session.headers.update({
             "Authorization": f"Bearer {openrouter_token}",
@@ -769,8 +1043,38 @@ Please generate production-ready code that fully resolves this issue.
 
 # ─── Section VII: TUI Functions ──────────────────────────────────────────────────
 
+# Per bool indizierbare Anzeige-Symbole
+_LOCK  = ("🔓", "🔒")
+_CHECK = ("✗", "✓")
+
+def _ellipsize(s: str, n: int) -> str:
+    """Kürzt einen String auf maximal n Zeichen (mit '…' am Ende)"""
+    return s if len(s) <= n else s[:n - 1] + "…"
+
+def _make_users_table(with_model: bool = False):
+    """Tabellen-Gerüst für die Benutzerübersicht (TUI und `users`-Befehl)"""
+    from rich.table import Table
+    table = Table(title="👥 Registrierte Benutzer")
+    table.add_column("Benutzername", style="cyan")
+    table.add_column("Status", style="green")
+    table.add_column("OpenRouter", style="blue")
+    if with_model:
+        table.add_column("AI-Model", style="magenta")
+    return table
+
+def _make_repos_table(owner: str):
+    """Tabellen-Gerüst für die Repository-Liste (`list-repos`-Befehl)"""
+    from rich.table import Table
+    table = Table(title=f"📁 Repositories von {owner}")
+    table.add_column("Name", style="cyan")
+    table.add_column("Sprache", style="blue")
+    table.add_column("Privat", style="red")
+    table.add_column("Beschreibung", style="white")
+    return table
+
 def safe_curses_wrapper(func: Callable) -> Any:
     """Wrapper für sichere Curses-Ausführung"""
+    import curses
     try:
         return curses.wrapper(func)
     except KeyboardInterrupt:
@@ -781,6 +1085,8 @@ def safe_curses_wrapper(func: Callable) -> Any:
 
 def run_curses_menu(options: List[str], title: str = "Auswahl") -> Optional[int]:
     """Curses-basiertes Auswahlmenü"""
+    import curses
+
     def menu_impl(stdscr):
         curses.curs_set(0)  # Cursor ausblenden
         stdscr.clear()
@@ -831,6 +1137,8 @@ def run_curses_menu(options: List[str], title: str = "Auswahl") -> Optional[int]
 
 def display_repository_info(repo_info: Dict[str, Any]):
     """Zeigt Repository-Informationen formatiert an"""
+    from rich.table import Table
+
     table = Table(title="📁 Repository Details")
     table.add_column("Eigenschaft", style="cyan", no_wrap=True)
     table.add_column("Wert", style="white")
@@ -871,11 +1179,8 @@ def get_repo_selection_with_details(repos: List[Dict[str, Any]], github_api: Git
         name = repo.get("name", "Unbekannt")
         desc = repo.get("description") or "Keine Beschreibung"
         lang = repo.get("language") or "?"
-        private = "🔒" if repo.get("private") else "🔓"
-        
-        # Kürze Beschreibung
-        if len(desc) > 50:
-            desc = desc[:47] + "..."
+        private = _LOCK[bool(repo.get("private"))]
+        desc = _ellipsize(desc, 50)
         
         option = f"{private} {name} ({lang}) - {desc}"
         options.append(option)
@@ -888,7 +1193,7 @@ def get_repo_selection_with_details(repos: List[Dict[str, Any]], github_api: Git
         selected_repo = repos_sorted[selected_idx]
         
         # Hole detaillierte Informationen
-        with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
+        with _spinner() as progress:
             task = progress.add_task("Lade Repository-Details...", total=None)
             
             owner = selected_repo.get("owner", {}).get("login")
@@ -933,12 +1238,12 @@ def tui_codex_generate():
         return
 
     # GitHub API initialisieren
-    github_api = GitHubAPI(user_config["token"])
+    github_api = get_github_api(user_config["token"])
     codex = CodexIntegration(openrouter_token, user_config.get("model", "openai/gpt-4o"))
 
     # Repository-Auswahl
     console.print("\n[bold blue]🔍 Lade Repositories...[/bold blue]")
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
+    with _spinner() as progress:
         task = progress.add_task("Repositories laden...", total=None)
         repos = github_api.list_repositories(active_user)
 
@@ -968,7 +1273,7 @@ def tui_codex_generate():
             return
 
         console.print(f"[blue]📥 Klone Repository nach {repo_path}...[/blue]")
-        with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
+        with _spinner() as progress:
             task = progress.add_task("Repository klonen...", total=None)
             success = LocalGitAPI.clone_repository(clone_url, repo_path, user_config["token"])
 
@@ -986,7 +1291,7 @@ def tui_codex_generate():
         console.print("[red]❌ Repository-Owner nicht gefunden![/red]")
         return
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
+    with _spinner() as progress:
         task = progress.add_task("Issues laden...", total=None)
         open_issues = github_api.get_issues(owner, repo_name, "open")
 
@@ -1017,9 +1322,7 @@ def tui_codex_generate():
         title = issue.get("title", "Unbekannt")
         number = issue.get("number", "?")
         labels = ", ".join([label.get("name", "") for label in issue.get("labels", [])])
-        
-        if len(title) > 60:
-            title = title[:57] + "..."
+        title = _ellipsize(title, 60)
         
         option = f"#{number}: {title} [{labels}]"
         issue_options.append(option)
@@ -1033,6 +1336,7 @@ def tui_codex_generate():
     selected_issue = in_work_issues[selected_issue_idx]
     
     # Issue-Details anzeigen
+    from rich.panel import Panel
     console.print(f"\n[bold blue]🎯 Gewähltes Issue:[/bold blue]")
     issue_panel = Panel(
         f"**Titel:** {selected_issue.get('title', 'N/A')}\n"
@@ -1045,7 +1349,7 @@ def tui_codex_generate():
     # Codex für dieses Issue ausführen
     console.print("\n[bold cyan]🤖 Starte erweiterte Codex-Generierung...[/bold cyan]")
     
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
+    with _spinner() as progress:
         task = progress.add_task("Codex-Generierung läuft...", total=None)
         success = codex.execute_codex_for_issue(selected_issue, repo_path, github_api)
 
@@ -1072,10 +1376,10 @@ def tui_list_repositories():
         console.print("[red]❌ Benutzer-Konfiguration nicht gefunden.[/red]")
         return
 
-    github_api = GitHubAPI(user_config["token"])
+    github_api = get_github_api(user_config["token"])
 
     console.print(f"\n[bold blue]🔍 Lade Repositories für {active_user}...[/bold blue]")
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
+    with _spinner() as progress:
         task = progress.add_task("Repositories laden...", total=None)
         repos = github_api.list_repositories(active_user)
 
@@ -1099,7 +1403,7 @@ def tui_create_repository():
         console.print("[red]❌ Benutzer-Konfiguration nicht gefunden.[/red]")
         return
 
-    github_api = GitHubAPI(user_config["token"])
+    github_api = get_github_api(user_config["token"])
 
     console.print("\n[bold blue]📁 Neues Repository erstellen[/bold blue]")
     
@@ -1123,7 +1427,7 @@ def tui_create_repository():
         console.print("[yellow]⚪ Erstellung abgebrochen.[/yellow]")
         return
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
+    with _spinner() as progress:
         task = progress.add_task("Repository erstellen...", total=None)
         success, result = github_api.create_repository(repo_name, description, private)
 
@@ -1139,7 +1443,7 @@ def tui_create_repository():
                 local_path = GITHUB_DIR / repo_name
                 console.print(f"[blue]📥 Klone nach {local_path}...[/blue]")
                 
-                with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
+                with _spinner() as progress:
                     task = progress.add_task("Repository klonen...", total=None)
                     clone_success = LocalGitAPI.clone_repository(clone_url, local_path, user_config["token"])
                 
@@ -1164,11 +1468,11 @@ def tui_delete_repository():
         console.print("[red]❌ Benutzer-Konfiguration nicht gefunden.[/red]")
         return
 
-    github_api = GitHubAPI(user_config["token"])
+    github_api = get_github_api(user_config["token"])
 
     console.print(f"\n[bold red]🗑️ Repository löschen für {active_user}[/bold red]")
     
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
+    with _spinner() as progress:
         task = progress.add_task("Repositories laden...", total=None)
         repos = github_api.list_repositories(active_user)
 
@@ -1194,7 +1498,7 @@ def tui_delete_repository():
         console.print("[yellow]⚪ Löschung abgebrochen.[/yellow]")
         return
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
+    with _spinner() as progress:
         task = progress.add_task("Repository löschen...", total=None)
         success = github_api.delete_repository(active_user, repo_name)
 
@@ -1266,7 +1570,7 @@ def tui_add_user():
     github_api = GitHubAPI(token)
     console.print("[blue]🔍 Validiere GitHub-Token...[/blue]")
     
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
+    with _spinner() as progress:
         task = progress.add_task("Token validieren...", total=None)
         success, user_info = github_api.get_user_info()
 
@@ -1407,23 +1711,18 @@ def tui_delete_user():
 
 def tui_list_users():
     """TUI zur Anzeige aller Benutzer"""
-    users = get_all_users()
+    users = load_all_user_configs(decode_tokens=False)
     if not users:
         console.print("[red]❌ Keine Benutzer gefunden![/red]")
         return
 
     current_user = get_active_user()
     
-    table = Table(title="👥 Registrierte Benutzer")
-    table.add_column("Benutzername", style="cyan")
-    table.add_column("Status", style="green")
-    table.add_column("OpenRouter", style="blue")
-    table.add_column("AI-Model", style="magenta")
+    table = _make_users_table(with_model=True)
     
-    for user in users:
-        config = load_user_config(user)
+    for user, config in users.items():
         status = "Aktiv" if user == current_user else "Inaktiv"
-        openrouter = "✓" if config and config.get("openrouter_token") else "✗"
+        openrouter = _CHECK[bool(config and config.get("openrouter_token"))]
         model = config.get("model", "N/A") if config else "N/A"
         
         table.add_row(user, status, openrouter, model)
@@ -1513,30 +1812,30 @@ def logout():
     """Aktiven Benutzer abmelden"""
     active_user = get_active_user()
     if not active_user:
-        console.print("[yellow]⚠ Kein aktiver Benutzer gesetzt.[/yellow]")
+        click.secho("⚠ Kein aktiver Benutzer gesetzt.", fg="yellow")
         return
     
     cfg = get_main_config()
     cfg['active_user'] = None
     save_main_config(cfg)
     
-    console.print(f"[green]✅ Benutzer '{active_user}' abgemeldet![/green]")
+    click.secho(f"✅ Benutzer '{active_user}' abgemeldet!", fg="green")
 
 @cli.command()
 def status():
     """Zeigt den aktuellen Status an"""
     active_user = get_active_user()
     
-    console.print("[bold blue]📊 grepo2 Status[/bold blue]")
-    console.print(f"Aktiver Benutzer: {active_user or 'Keiner'}")
-    console.print(f"Config-Verzeichnis: {CONFIG_DIR}")
-    console.print(f"GitHub-Verzeichnis: {GITHUB_DIR}")
+    click.secho("📊 grepo2 Status", fg="blue", bold=True)
+    click.echo(f"Aktiver Benutzer: {active_user or 'Keiner'}")
+    click.echo(f"Config-Verzeichnis: {CONFIG_DIR}")
+    click.echo(f"GitHub-Verzeichnis: {GITHUB_DIR}")
     
     if active_user:
         user_config = load_user_config(active_user)
         if user_config:
-            console.print(f"OpenRouter Token: {'Gesetzt' if user_config.get('openrouter_token') else 'Nicht gesetzt'}")
-            console.print(f"AI-Model: {user_config.get('model', 'openai/gpt-4o')}")
+            click.echo(f"OpenRouter Token: {'Gesetzt' if user_config.get('openrouter_token') else 'Nicht gesetzt'}")
+            click.echo(f"AI-Model: {user_config.get('model', 'openai/gpt-4o')}")
 
 @cli.command()
 def list_repos():
@@ -1551,36 +1850,38 @@ def list_repos():
         console.print("[red]❌ Benutzer-Konfiguration nicht gefunden.[/red]")
         return
 
-    github_api = GitHubAPI(user_config["token"])
+    github_api = get_github_api(user_config["token"])
     
     console.print(f"[blue]🔍 Lade Repositories für {active_user}...[/blue]")
-    repos = github_api.list_repositories(active_user)
+    pages = github_api.iter_repository_pages(active_user)
+    first_page = next(pages, [])
     
-    if not repos:
+    if not first_page:
         console.print("[red]❌ Keine Repositories gefunden![/red]")
         return
 
-    table = Table(title=f"📁 Repositories von {active_user}")
-    table.add_column("Name", style="cyan")
-    table.add_column("Sprache", style="blue")
-    table.add_column("Privat", style="red")
-    table.add_column("Beschreibung", style="white")
+    from rich.live import Live
+    table = _make_repos_table(active_user)
+    total = 0
     
-    for repo in repos[:20]:  # Erste 20
-        name = repo.get("name", "N/A")
-        language = repo.get("language") or "N/A"
-        private = "🔒" if repo.get("private") else "🔓"
-        description = repo.get("description") or "Keine Beschreibung"
-        
-        if len(description) > 50:
-            description = description[:47] + "..."
-        
-        table.add_row(name, language, private, description)
+    # Zeilen erscheinen, sobald die jeweilige Seite geladen ist
+    with Live(table, refresh_per_second=10) as live:
+        for page in itertools.chain([first_page], pages):
+            rows = [
+                (r.get("name", "N/A"),
+                 r.get("language") or "N/A",
+                 _LOCK[bool(r.get("private"))],
+                 _ellipsize(r.get("description") or "Keine Beschreibung", 50))
+                for r in page[:max(0, 20 - total)]  # Erste 20
+            ]
+            for row in rows:
+                table.add_row(*row)
+            total += len(page)
+            if rows:
+                live.refresh()
     
-    console.print(table)
-    
-    if len(repos) > 20:
-        console.print(f"[dim]... und {len(repos) - 20} weitere[/dim]")
+    if total > 20:
+        console.print(f"[dim]... und {total - 20} weitere[/dim]")
 
 @cli.command()
 @click.argument('repo_name')
@@ -1598,7 +1899,7 @@ def create_repo(repo_name, description, private):
         console.print("[red]❌ Benutzer-Konfiguration nicht gefunden.[/red]")
         return
 
-    github_api = GitHubAPI(user_config["token"])
+    github_api = get_github_api(user_config["token"])
     
     console.print(f"[blue]📁 Erstelle Repository '{repo_name}'...[/blue]")
     success, result = github_api.create_repository(repo_name, description, private)
@@ -1614,7 +1915,8 @@ def create_repo(repo_name, description, private):
 @cli.command()
 @click.argument('repo_name')
 @click.option('--force', is_flag=True, help='Löschen ohne Bestätigung erzwingen')
-def delete_repo(repo_name, force):
+@click.option('--strict', is_flag=True, help='Zur Bestätigung den Repository-Namen eintippen')
+def delete_repo(repo_name, force, strict):
     """Löscht ein Repository"""
     active_user = get_active_user()
     if not active_user:
@@ -1626,15 +1928,20 @@ def delete_repo(repo_name, force):
         console.print("[red]❌ Benutzer-Konfiguration nicht gefunden.[/red]")
         return
 
-    github_api = GitHubAPI(user_config["token"])
-    
     if not force:
         console.print(f"[red]⚠️ WARNUNG: Repository '{repo_name}' wird unwiderruflich gelöscht![/red]")
-        confirm = console.input(f"Zum Bestätigen '{repo_name}' eingeben: ").strip()
-        if confirm != repo_name:
+        if strict:
+            # Direkt von stdin lesen: pipe-freundlich (z.B. `echo name | grepo2 delete-repo --strict name`)
+            sys.stdout.write(f"Zum Bestätigen '{repo_name}' eingeben: ")
+            sys.stdout.flush()
+            confirmed = hmac.compare_digest(sys.stdin.readline().strip().encode(), repo_name.encode())
+        else:
+            confirmed = click.confirm(f"Repository '{repo_name}' löschen?", default=False)
+        if not confirmed:
             console.print("[yellow]⚪ Löschung abgebrochen.[/yellow]")
             return
 
+    github_api = get_github_api(user_config["token"])
     console.print(f"[red]🗑️ Lösche Repository '{repo_name}'...[/red]")
     success = github_api.delete_repository(active_user, repo_name)
     
@@ -1643,6 +1950,90 @@ def delete_repo(repo_name, force):
     else:
         console.print("[red]❌ Repository-Löschung fehlgeschlagen![/red]")
 
+def _read_repo_names(names_file) -> List[str]:
+    """Liest Repository-Namen (ein Name pro Zeile, # für Kommentare)"""
+    return [line.strip() for line in names_file if line.strip() and not line.lstrip().startswith("#")]
+
+@cli.command()
+@click.argument('names_file', type=click.File('r'))
+@click.option('--private', is_flag=True, help='Private Repositories erstellen')
+def bulk_create_repos(names_file, private):
+    """Erstellt alle Repositories aus einer Datei (ein Name pro Zeile)"""
+    active_user = get_active_user()
+    if not active_user:
+        console.print("[red]❌ Kein aktiver Benutzer gesetzt.[/red]")
+        return
+
+    user_config = load_user_config(active_user)
+    if not user_config:
+        console.print("[red]❌ Benutzer-Konfiguration nicht gefunden.[/red]")
+        return
+
+    names = _read_repo_names(names_file)
+    github_api = get_github_api(user_config["token"])
+
+    console.print(f"[blue]🔍 Prüfe {len(names)} Repositories...[/blue]")
+    exists = github_api.repositories_exist(active_user, names)
+    if exists is None:
+        console.print("[red]❌ GraphQL-Abfrage fehlgeschlagen![/red]")
+        return
+
+    for name in names:
+        if exists[name]:
+            console.print(f"[yellow]⚪ '{name}' existiert bereits, übersprungen.[/yellow]")
+            continue
+        success, result = github_api.create_repository(name, "", private)
+        if success:
+            console.print(f"[green]✅ '{name}' erstellt: {result.get('html_url', 'N/A')}[/green]")
+        else:
+            message = result.get('message', 'Unbekannter Fehler') if result else 'Unbekannter Fehler'
+            console.print(f"[red]❌ '{name}' fehlgeschlagen: {message}[/red]")
+
+@cli.command()
+@click.argument('names_file', type=click.File('r'))
+@click.option('--force', is_flag=True, help='Löschen ohne Bestätigung erzwingen')
+def bulk_delete_repos(names_file, force):
+    """Löscht alle Repositories aus einer Datei (ein Name pro Zeile)"""
+    active_user = get_active_user()
+    if not active_user:
+        console.print("[red]❌ Kein aktiver Benutzer gesetzt.[/red]")
+        return
+
+    user_config = load_user_config(active_user)
+    if not user_config:
+        console.print("[red]❌ Benutzer-Konfiguration nicht gefunden.[/red]")
+        return
+
+    names = _read_repo_names(names_file)
+    github_api = get_github_api(user_config["token"])
+
+    exists = github_api.repositories_exist(active_user, names)
+    if exists is None:
+        console.print("[red]❌ GraphQL-Abfrage fehlgeschlagen![/red]")
+        return
+
+    for name in names:
+        if not exists[name]:
+            console.print(f"[yellow]⚪ '{name}' nicht gefunden, übersprungen.[/yellow]")
+    existing = [name for name in names if exists[name]]
+    if not existing:
+        return
+
+    if not force:
+        console.print(f"[red]⚠️ WARNUNG: {len(existing)} Repositories werden unwiderruflich gelöscht:[/red]")
+        for name in existing:
+            console.print(f"  - {name}")
+        confirm = console.input("[red]Endgültig löschen? Tippe 'DELETE':[/red] ").strip()
+        if confirm != "DELETE":
+            console.print("[yellow]⚪ Löschung abgebrochen.[/yellow]")
+            return
+
+    for name in existing:
+        if github_api.delete_repository(active_user, name):
+            console.print(f"[green]✅ '{name}' gelöscht.[/green]")
+        else:
+            console.print(f"[red]❌ '{name}' konnte nicht gelöscht werden.[/red]")
+
 @cli.command()
 def codex():
     """Startet Codex-Code-Generierung"""
@@ -1651,22 +2042,18 @@ def codex():
 @cli.command()
 def users():
     """Zeigt alle registrierten Benutzer"""
-    users_list = get_all_users()
-    if not users_list:
+    configs = load_all_user_configs(decode_tokens=False)
+    if not configs:
         console.print("[red]❌ Keine Benutzer gefunden![/red]")
         return
 
     current_user = get_active_user()
     
-    table = Table(title="👥 Registrierte Benutzer")
-    table.add_column("Benutzername", style="cyan")
-    table.add_column("Status", style="green")
-    table.add_column("OpenRouter", style="blue")
+    table = _make_users_table()
     
-    for user in users_list:
-        config = load_user_config(user)
+    for user, config in configs.items():
         status = "Aktiv" if user == current_user else "Inaktiv"
-        openrouter = "✓" if config and config.get("openrouter_token") else "✗"
+        openrouter = _CHECK[bool(config and config.get("openrouter_token"))]
         
         table.add_row(user, status, openrouter)
     
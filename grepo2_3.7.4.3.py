@@ -32,40 +32,112 @@ import os
 import json
 import subprocess
 import time
-import curses
 import textwrap
-import base64
-import filecmp
+import re
+import functools
+import heapq
+import hashlib
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple, Callable
-from getpass import getpass
+from operator import itemgetter
+from urllib.parse import urlparse, parse_qs
+
+try:
+    import pybase64 as _b64  # SIMD-beschleunigt, API-kompatibel zu base64
+except ImportError:
+    import base64 as _b64
+
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
 
 import click
 import requests
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.progress import track
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+class _LazyConsole:
+    """Proxy für rich.Console – rich wird erst bei der ersten Ausgabe importiert"""
+    _console = None
+
+    def __getattr__(self, name):
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
 
-console = Console()
+console = _LazyConsole()
 
 # ─── Section I: Core Infrastructure ─────────────────────────────────────────────
 
+TOOL_CHECK_TTL = 24 * 60 * 60  # Erfolgreiche Tool-Checks gelten 24h
+GIT_CHECK_TTL = 30 * 24 * 60 * 60  # Git verschwindet praktisch nie – 30 Tage reichen
+
+def _tool_check_cached(tool: str, ttl: int = TOOL_CHECK_TTL) -> Optional[str]:
+    """Liefert die gespeicherte Version eines Tools, falls der letzte Check jünger als `ttl` Sekunden ist"""
+    try:
+        with open(TOOL_CHECK_FILE, 'r', encoding='utf-8') as f:
+            entry = json.load(f).get(tool)
+        if entry and time.time() - entry["ts"] < ttl:
+            return entry["version"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def _tool_check_store(tool: str, version: str) -> None:
+    """Merkt sich einen erfolgreichen Tool-Check mit Zeitstempel"""
+    try:
+        with open(TOOL_CHECK_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    data[tool] = {"version": version, "ts": time.time()}
+    try:
+        with open(TOOL_CHECK_FILE, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+    except OSError:
+        pass
+
+@functools.lru_cache(maxsize=1)
 def check_git_cli() -> bool:
-    """Prüft ob Git CLI verfügbar ist"""
+    """Prüft ob Git CLI verfügbar ist (Ergebnis gecacht)"""
+    version = _tool_check_cached("git", GIT_CHECK_TTL)
+    if version:
+        console.print(f"[green]✓ Git CLI gefunden: {version}[/green]")
+        return True
     try:
         result = subprocess.run(["git", "--version"], check=True, capture_output=True, text=True)
-        console.print(f"[green]✓ Git CLI gefunden: {result.stdout.strip()}[/green]")
+        version = result.stdout.strip()
+        _tool_check_store("git", version)
+        console.print(f"[green]✓ Git CLI gefunden: {version}[/green]")
         return True
     except (FileNotFoundError, subprocess.CalledProcessError):
         console.print("[red]❌ Git CLI nicht gefunden. Bitte installieren Sie Git.[/red]")
         return False
 
+@functools.lru_cache(maxsize=1)
 def check_codex_cli() -> bool:
-    """Prüft ob Codex CLI installiert ist, installiert es falls nötig"""
+    """Prüft ob Codex CLI installiert ist, installiert es falls nötig (Ergebnis gecacht)"""
+    version = _tool_check_cached("codex")
+    if version:
+        console.print(f"[green]✓ Codex CLI gefunden: {version}[/green]")
+        return True
     try:
         result = subprocess.run(["codex", "--version"], check=True, capture_output=True, text=True)
-        console.print(f"[green]✓ Codex CLI gefunden: {result.stdout.strip()}[/green]")
+        version = result.stdout.strip()
+        _tool_check_store("codex", version)
+        console.print(f"[green]✓ Codex CLI gefunden: {version}[/green]")
         return True
     except (FileNotFoundError, subprocess.CalledProcessError):
         console.print("[yellow]⚠ Codex CLI nicht gefunden. Installation wird versucht...[/yellow]")
@@ -83,20 +155,29 @@ USERS_DIR   = CONFIG_DIR  / "users"
 GITHUB_DIR  = Path.home()  / "github2"
 CONFIG_FILE = CONFIG_DIR   / "config.json"
 CODEX_DIR   = Path.home()  / ".codex"
+TOOL_CHECK_FILE = CONFIG_DIR / "tool_check.json"
+REPO_SIZES_FILE = CONFIG_DIR / "repo_sizes.json"
+INSTALL_CHECK_FILE = CONFIG_DIR / "install_check.json"
+OPENROUTER_MODELS_DIR = CONFIG_DIR / "openrouter_models"
+OPENROUTER_MODELS_TTL = 24 * 3600  # Modellkatalog ändert sich höchstens täglich
 for p in (CONFIG_DIR, USERS_DIR, GITHUB_DIR, CODEX_DIR):
     p.mkdir(parents=True, exist_ok=True)
 
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Schreibt Datei atomar (tmp + os.replace), damit keine halbe JSON-Datei zurückbleibt"""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
 def _obfuscate(data: str) -> str:
-    return base64.b64encode(data.encode()).decode()
+    return _b64.b64encode(data.encode()).decode('ascii')
 
 def _deobfuscate(data: str) -> str:
     """Deobfuscate base64 encoded data with proper padding handling"""
     try:
         # Add padding if necessary (base64 strings must be multiples of 4)
-        missing_padding = len(data) % 4
-        if missing_padding:
-            data += '=' * (4 - missing_padding)
-        return base64.b64decode(data.encode()).decode()
+        data += "==="[:-len(data) & 3]
+        return _b64.b64decode(data.encode()).decode()
     except Exception as e:
         # If deobfuscation fails, assume data is already plain text (backward compatibility)
         console.print(f"[yellow]⚠ Deobfuscation failed, using raw data: {e}[/yellow]")
@@ -105,37 +186,68 @@ def _deobfuscate(data: str) -> str:
 
 # ─── Section II: Configuration Management ───────────────────────────────────────
 
+# Im Speicher gehaltene Konfiguration, invalidiert über die mtime der Datei
+_config_cache: Optional[Dict[str, Any]] = None
+_config_mtime: Optional[float] = None
+
 def load_config() -> Dict[str, Any]:
-    """Lädt die globale Konfiguration"""
-    if CONFIG_FILE.exists():
+    """Lädt die globale Konfiguration (gecacht, solange sich die Datei nicht ändert)"""
+    global _config_cache, _config_mtime
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime
+    except OSError:
+        _config_cache, _config_mtime = None, None
+        return {}
+    if _config_cache is None or mtime != _config_mtime:
         try:
             with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                _config_cache = json.load(f)
+            _config_mtime = mtime
         except Exception as e:
             console.print(f"[yellow]⚠ Fehler beim Laden der Konfiguration: {e}[/yellow]")
-    return {}
+            return {}
+    return dict(_config_cache)
 
 def save_config(config: Dict[str, Any]) -> None:
     """Speichert die globale Konfiguration"""
+    global _config_cache, _config_mtime
     try:
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        _atomic_write(CONFIG_FILE, _dumps(config))
+        _config_cache = dict(config)
+        _config_mtime = os.stat(CONFIG_FILE).st_mtime
     except Exception as e:
+        _config_cache, _config_mtime = None, None
         console.print(f"[red]❌ Fehler beim Speichern der Konfiguration: {e}[/red]")
 
+def _config() -> Dict[str, Any]:
+    """Gibt das gecachte Konfigurations-Dict selbst zurück (nur lesen oder danach speichern)"""
+    load_config()
+    if _config_cache is None:
+        return {}
+    return _config_cache
+
 def get_active_user() -> Optional[str]:
     """Gibt den aktiven Benutzer zurück"""
-    config = load_config()
-    return config.get("active_user")
+    return _config().get("active_user")
 
 def set_active_user(username: str) -> None:
     """Setzt den aktiven Benutzer"""
-    config = load_config()
+    config = _config()
     config["active_user"] = username
     save_config(config)
 
 def load_user_config(username: str) -> Optional[Dict[str, Any]]:
-    """Lädt die Konfiguration eines Benutzers"""
+    """Lädt die Konfiguration eines Benutzers (gecacht über Benutzername + mtime)"""
+    try:
+        mtime = (USERS_DIR / f"{username}.json").stat().st_mtime_ns
+    except OSError:
+        return None
+    data = _load_user_config_impl(username, mtime)
+    return dict(data) if data is not None else None
+
+@functools.lru_cache(maxsize=32)
+def _load_user_config_impl(username: str, mtime: int) -> Optional[Dict[str, Any]]:
+    """Liest und dekodiert die Benutzerdatei; mtime dient nur als Cache-Schlüssel"""
     user_file = USERS_DIR / f"{username}.json"
     if user_file.exists():
         try:
@@ -175,15 +287,32 @@ def save_user_config(username: str, token: str, openrouter_token: str = "", mode
         "created_at": time.strftime("%Y-%m-%d %H:%M:%S")
     }
     try:
-        with open(user_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2)
+        _atomic_write(user_file, _dumps(config))
+        _load_user_config_impl.cache_clear()
         console.print(f"[green]✓ Benutzer-Konfiguration gespeichert: {user_file}[/green]")
     except Exception as e:
         console.print(f"[red]❌ Fehler beim Speichern der Benutzer-Konfiguration: {e}[/red]")
 
 
+_SECRET_FIELDS = ("token", "openrouter_token")
+
+def update_user_field(username: str, **updates: Any) -> None:
+    """Aktualisiert einzelne Felder der Benutzerdatei; nur übergebene Tokens werden neu kodiert"""
+    user_file = USERS_DIR / f"{username}.json"
+    try:
+        config = _loads(user_file.read_bytes()) if user_file.exists() else {"username": username}
+        for key, value in updates.items():
+            config[key] = _obfuscate(value) if key in _SECRET_FIELDS and value else value
+        _atomic_write(user_file, _dumps(config))
+        _load_user_config_impl.cache_clear()
+        console.print(f"[green]✓ Benutzer-Konfiguration gespeichert: {user_file}[/green]")
+    except Exception as e:
+        console.print(f"[red]❌ Fehler beim Speichern der Benutzer-Konfiguration: {e}[/red]")
+
 # ─── Section III: CHANGELOG.md Integration (v3.7.3 Feature) ─────────────────────
 
+_UNRELEASED_RE = re.compile(r'^## .*unreleased', re.I | re.M)
+
 def write_to_changelog(message: str, category: str = "info") -> None:
     """Schreibt automatisch in CHANGELOG.md mit Timestamp und Emoji"""
     changelog_path = Path.cwd() / "CHANGELOG.md"
@@ -211,25 +340,25 @@ def write_to_changelog(message: str, category: str = "info") -> None:
             with open(changelog_path, 'r', encoding='utf-8') as f:
                 content = f.read()
         
-        # Füge neuen Eintrag nach der ersten Überschrift ein
-        lines = content.split('\n')
-        insert_pos = 0
-        
-        # Finde Position nach "## [Unreleased]" oder ähnlich
-        for i, line in enumerate(lines):
-            if line.startswith('## ') and 'unreleased' in line.lower():
-                insert_pos = i + 1
-                break
-            elif line.startswith('### ') and i > 5:  # Nach ersten paar Zeilen
-                insert_pos = i
-                break
-        
-        # Füge Eintrag ein
-        lines.insert(insert_pos, entry)
-        
+        # Finde Zeile "## [Unreleased]" oder ähnlich direkt im Original (lower() kann Längen ändern)
+        match = _UNRELEASED_RE.search(content)
+
+        # Ohne [Unreleased]-Abschnitt nur anhängen statt die ganze Datei neu zu schreiben
+        if match is None:
+            with open(changelog_path, 'a', encoding='utf-8') as f:
+                f.write(entry)
+            return
+
+        # Füge Eintrag direkt nach der Überschrift ein
+        line_end = content.find('\n', match.end())
+        if line_end == -1:
+            content = content + '\n' + entry
+        else:
+            content = content[:line_end + 1] + entry + '\n' + content[line_end + 1:]
+
         # Schreibe zurück
         with open(changelog_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+            f.write(content)
             
     except Exception as e:
         console.print(f"[yellow]⚠ CHANGELOG.md Update fehlgeschlagen: {e}[/yellow]")
@@ -237,10 +366,37 @@ def write_to_changelog(message: str, category: str = "info") -> None:
 
 # ─── Section IV: OpenRouter Model Fetching (v3.7.4.2 Feature) ───────────────────
 
-def fetch_openrouter_models(token: str) -> List[Dict[str, Any]]:
-    """Fetch free coding models from OpenRouter API (v3.7.4.2 - FIXED NoneType comparison)"""
+_OR_SESSION = requests.Session()
+
+# Coding-Schlüsselwörter: code, coding, development, developer, programming, software
+_CODING_RE = re.compile(r"cod(?:e|ing)|develop(?:er|ment)|programming|software", re.I)
+
+def _is_free_coding(model: Dict[str, Any]) -> bool:
+    """Prüft ob ein OpenRouter-Model kostenlos und coding-bezogen ist"""
+    pricing = model.get("pricing", {})
+    # Skip if pricing info is missing or not free
+    if (prompt_price := pricing.get("prompt")) is None or (completion_price := pricing.get("completion")) is None:
+        return False
+    if float(prompt_price) > 0 or float(completion_price) > 0:
+        return False
+    return _CODING_RE.search(f"{model.get('id', '')}\n{model.get('name', '')}\n{model.get('description', '')}") is not None
+
+def fetch_openrouter_models(token: str, refresh: bool = False) -> List[Dict[str, Any]]:
+    """Fetch free coding models from OpenRouter API (v3.7.4.2 - FIXED NoneType comparison)
+
+    Das Ergebnis wird 24h pro Token in OPENROUTER_MODELS_DIR zwischengespeichert
+    (ein ungültiger Token trifft so nie einen Cache-Eintrag); refresh=True erzwingt
+    einen neuen Abruf.
+    """
+    cache_file = OPENROUTER_MODELS_DIR / f"{hashlib.sha256(token.encode()).hexdigest()[:16]}.json"
+    if not refresh:
+        try:
+            if time.time() - cache_file.stat().st_mtime < OPENROUTER_MODELS_TTL:
+                return _loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            pass
     try:
-        response = requests.get(
+        response = _OR_SESSION.get(
             "https://openrouter.ai/api/v1/models", 
             headers={"Authorization": f"Bearer {token}"},
             timeout=10
@@ -250,43 +406,25 @@ def fetch_openrouter_models(token: str) -> List[Dict[str, Any]]:
             console.print(f"[red]❌ OpenRouter API Error: {response.status_code}[/red]")
             return []
         
-        models = response.json().get("data", [])
+        models = _loads(response.content).get("data", [])
         
         # Filter for free coding models with proper None handling
-        coding_models = []
-        for model in models:
-            # Check if it's free
-            pricing = model.get("pricing", {})
-            prompt_price = pricing.get("prompt")
-            completion_price = pricing.get("completion")
-            
-            # Skip if pricing info is missing or not free
-            if prompt_price is None or completion_price is None:
-                continue
-            if float(prompt_price) > 0 or float(completion_price) > 0:
-                continue
-            
-            # Check if it's coding-related
-            model_id = model.get("id", "").lower()
-            model_name = model.get("name", "").lower()
-            description = model.get("description", "").lower()
-            
-            coding_keywords = ["code", "coding", "development", "developer", "programming", "software"]
-            
-            if any(keyword in model_id or keyword in model_name or keyword in description for keyword in coding_keywords):
-                # Add rating for sorting (handle None values properly)
-                rating = model.get("rating")
-                if rating is not None:
-                    model["sort_rating"] = float(rating)
-                else:
-                    model["sort_rating"] = 0.0  # Default rating for models without rating
-                
-                coding_models.append(model)
+        coding_models = [model for model in models if _is_free_coding(model)]
         
-        # Sort by rating (lowest first) with proper None handling
-        coding_models.sort(key=lambda x: x.get("sort_rating", 0.0))
+        # Add rating for sorting (handle None values properly)
+        for model in coding_models:
+            rating = model.get("rating")
+            model["sort_rating"] = float(rating) if rating is not None else 0.0
         
-        return coding_models[:4]  # Return top 4
+        # Top 4 by rating (lowest first) – sort_rating ist für jedes Model gesetzt
+        top_models = heapq.nsmallest(4, coding_models, key=itemgetter("sort_rating"))
+        if top_models:
+            try:
+                OPENROUTER_MODELS_DIR.mkdir(parents=True, exist_ok=True)
+                _atomic_write(cache_file, _dumps(top_models))
+            except OSError:
+                pass
+        return top_models
         
     except requests.exceptions.Timeout:
         console.print("[red]❌ OpenRouter API Timeout[/red]")
@@ -301,6 +439,10 @@ def fetch_openrouter_models(token: str) -> List[Dict[str, Any]]:
 
 # ─── Section V: GitHub API Integration ──────────────────────────────────────────
 
+# Vorab geladene Issues: {(owner, repo, state): (zeitpunkt, issues)}, gültig ISSUE_PREFETCH_TTL Sekunden
+_ISSUE_PREFETCH: Dict[Tuple[str, str, str], Tuple[float, List[Dict[str, Any]]]] = {}
+ISSUE_PREFETCH_TTL = 60
+
 class GitHubAPI:
     """GitHub API Client mit erweiterten Features für v3.7.4"""
     
@@ -308,43 +450,85 @@ class GitHubAPI:
         self.token = token
         self.headers = {
             "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "grepo2-v3.7.4.3"
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "grepo2/3.7.4.3"
         }
         self.base_url = "https://api.github.com"
+        # Gemeinsame Session: Keep-Alive statt neuem TCP/TLS-Handshake pro Aufruf,
+        # Pool groß genug für parallele Seitenabrufe, Retry bei 502/503/504
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4, pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+        ))
+        self._repo_prefetch: Dict[str, Future] = {}
 
     def get_user_info(self) -> Tuple[bool, Dict[str, Any]]:
         """Holt Benutzerinformationen"""
         try:
-            response = requests.get(f"{self.base_url}/user", headers=self.headers)
+            response = self.session.get(f"{self.base_url}/user")
             if response.status_code == 200:
-                return True, response.json()
+                return True, _loads(response.content)
             else:
                 return False, {"error": f"HTTP {response.status_code}"}
         except Exception as e:
             return False, {"error": str(e)}
 
+    def _fetch_repo_page(self, username: str, page: int) -> requests.Response:
+        """Holt eine Seite der Repository-Liste"""
+        return self.session.get(
+            f"{self.base_url}/users/{username}/repos",
+            params={"page": page, "per_page": 100, "sort": "updated"}
+        )
+
+    def prefetch_repositories(self, username: str) -> None:
+        """Startet list_repositories im Hintergrund; der nächste Aufruf holt das Ergebnis ab"""
+        if username in self._repo_prefetch:
+            return
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._repo_prefetch[username] = executor.submit(self._fetch_all_repositories, username)
+        executor.shutdown(wait=False)
+
     def list_repositories(self, username: str) -> List[Dict[str, Any]]:
-        """Listet alle Repositories eines Benutzers auf"""
+        """Listet alle Repositories eines Benutzers auf (nutzt ein laufendes Prefetch)"""
+        prefetched = self._repo_prefetch.pop(username, None)
+        if prefetched is not None:
+            return prefetched.result()
+        return self._fetch_all_repositories(username)
+
+    def _fetch_all_repositories(self, username: str) -> List[Dict[str, Any]]:
+        """Lädt alle Repository-Seiten (Folgeseiten parallel)"""
         try:
-            all_repos = []
-            page = 1
-            while True:
-                response = requests.get(
-                    f"{self.base_url}/users/{username}/repos",
-                    headers=self.headers,
-                    params={"page": page, "per_page": 100, "sort": "updated"}
-                )
+            response = self._fetch_repo_page(username, 1)
+            if response.status_code != 200:
+                return []
+            all_repos = _loads(response.content)
+
+            # Link-Header (rel="last") verrät die Seitenanzahl → restliche Seiten parallel laden
+            last_url = response.links.get("last", {}).get("url")
+            if last_url:
+                last_page = int(parse_qs(urlparse(last_url).query)["page"][0])
+                with ThreadPoolExecutor(max_workers=8) as pool:
+                    pages = pool.map(lambda n: self._fetch_repo_page(username, n), range(2, last_page + 1))
+                    for page_response in pages:
+                        if page_response.status_code != 200:
+                            break
+                        all_repos.extend(_loads(page_response.content))
+                return all_repos
+
+            # Ohne Link-Header: sequentiell weiterblättern bis zur leeren Seite
+            page = 2
+            repos = all_repos
+            while repos:
+                response = self._fetch_repo_page(username, page)
                 if response.status_code != 200:
                     break
-                    
-                repos = response.json()
-                if not repos:
-                    break
-                    
+                repos = _loads(response.content)
                 all_repos.extend(repos)
                 page += 1
-                
+
             return all_repos
         except Exception as e:
             console.print(f"[red]❌ Fehler beim Laden der Repositories: {e}[/red]")
@@ -353,39 +537,109 @@ class GitHubAPI:
     def get_repository_info(self, owner: str, repo: str) -> Tuple[bool, Dict[str, Any]]:
         """Holt detaillierte Repository-Informationen"""
         try:
-            response = requests.get(f"{self.base_url}/repos/{owner}/{repo}", headers=self.headers)
+            response = self.session.get(f"{self.base_url}/repos/{owner}/{repo}")
             if response.status_code == 200:
-                return True, response.json()
+                return True, _loads(response.content)
             else:
                 return False, {"error": f"HTTP {response.status_code}"}
         except Exception as e:
             return False, {"error": str(e)}
 
-    def list_issues(self, owner: str, repo: str, state: str = "open") -> Tuple[bool, List[Dict[str, Any]]]:
-        """Listet Issues eines Repositories auf"""
+    def graphql(self, query: str, variables: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
+        """Führt eine GraphQL-Abfrage gegen die GitHub API v4 aus"""
         try:
-            response = requests.get(
+            response = self.session.post(f"{self.base_url}/graphql", json={"query": query, "variables": variables})
+            if response.status_code != 200:
+                return False, {"error": f"HTTP {response.status_code}"}
+            payload = _loads(response.content)
+            if payload.get("errors"):
+                return False, {"error": payload["errors"][0].get("message", "GraphQL-Fehler")}
+            return True, payload.get("data") or {}
+        except Exception as e:
+            return False, {"error": str(e)}
+
+    _ISSUES_QUERY = """
+    query($owner: String!, $name: String!, $states: [IssueState!], $first: Int!, $cursor: String) {
+      repository(owner: $owner, name: $name) {
+        issues(first: $first, after: $cursor, states: $states, orderBy: {field: CREATED_AT, direction: DESC}) {
+          pageInfo { hasNextPage endCursor }
+          nodes { number title body labels(first: 20) { nodes { name } } }
+        }
+      }
+    }
+    """
+
+    def list_issues_graphql(self, owner: str, repo: str, state: str = "open", limit: int = 100,
+                            quiet: bool = False) -> Tuple[bool, List[Dict[str, Any]]]:
+        """Listet Issues samt Labels und Body in einem GraphQL-Roundtrip pro 100 Issues (REST-kompatible Dicts)"""
+        states = {"open": ["OPEN"], "closed": ["CLOSED"]}.get(state, ["OPEN", "CLOSED"])
+        issues: List[Dict[str, Any]] = []
+        cursor = None
+        while len(issues) < limit:
+            variables = {"owner": owner, "name": repo, "states": states,
+                         "first": min(100, limit - len(issues)), "cursor": cursor}
+            success, data = self.graphql(self._ISSUES_QUERY, variables)
+            if not success or not data.get("repository"):
+                if not quiet:
+                    console.print(f"[red]❌ Fehler beim Laden der Issues: {data.get('error', 'Repository nicht gefunden')}[/red]")
+                return False, []
+            connection = data["repository"]["issues"]
+            issues.extend(
+                {
+                    "number": node["number"],
+                    "title": node["title"],
+                    "body": node["body"],
+                    "labels": [{"name": label["name"]} for label in node["labels"]["nodes"]],
+                }
+                for node in connection["nodes"]
+            )
+            if not connection["pageInfo"]["hasNextPage"]:
+                break
+            cursor = connection["pageInfo"]["endCursor"]
+        return True, issues
+
+    def list_issues(self, owner: str, repo: str, state: str = "open", graphql: bool = False) -> Tuple[bool, List[Dict[str, Any]]]:
+        """Listet Issues eines Repositories auf (optional über GraphQL, ohne Pull Requests)"""
+        if graphql:
+            prefetched = _ISSUE_PREFETCH.get((owner, repo, state))
+            if prefetched and time.time() - prefetched[0] < ISSUE_PREFETCH_TTL:
+                return True, prefetched[1]
+            return self.list_issues_graphql(owner, repo, state)
+        try:
+            response = self.session.get(
                 f"{self.base_url}/repos/{owner}/{repo}/issues",
-                headers=self.headers,
                 params={"state": state, "per_page": 100}
             )
             if response.status_code == 200:
-                return True, response.json()
+                return True, _loads(response.content)
             else:
                 return False, []
         except Exception as e:
             console.print(f"[red]❌ Fehler beim Laden der Issues: {e}[/red]")
             return False, []
 
+    def prefetch_issues(self, owner: str, repos: List[str]) -> None:
+        """Lädt offene Issues mehrerer Repositories im Hintergrund (max. 5 parallel)"""
+        def fetch(repo: str) -> None:
+            success, issues = self.list_issues_graphql(owner, repo, quiet=True)
+            if success:
+                _ISSUE_PREFETCH[(owner, repo, "open")] = (time.time(), issues)
+
+        def run() -> None:
+            with ThreadPoolExecutor(max_workers=5) as pool:
+                for _ in pool.map(fetch, repos):
+                    pass
+
+        threading.Thread(target=run, daemon=True).start()
+
     def get_issue_comments(self, owner: str, repo: str, issue_number: int) -> Tuple[bool, List[Dict[str, Any]]]:
         """Holt alle Kommentare zu einem Issue"""
         try:
-            response = requests.get(
-                f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}/comments",
-                headers=self.headers
+            response = self.session.get(
+                f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}/comments"
             )
             if response.status_code == 200:
-                return True, response.json()
+                return True, _loads(response.content)
             else:
                 return False, []
         except Exception as e:
@@ -395,9 +649,8 @@ class GitHubAPI:
     def create_issue_comment(self, owner: str, repo: str, issue_number: int, body: str) -> bool:
         """Erstellt einen Kommentar zu einem Issue"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}/comments",
-                headers=self.headers,
                 json={"body": body}
             )
             return response.status_code == 201
@@ -413,9 +666,8 @@ class GitHubAPI:
                 self.create_issue_comment(owner, repo, issue_number, comment)
             
             # Schließe das Issue
-            response = requests.patch(
+            response = self.session.patch(
                 f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}",
-                headers=self.headers,
                 json={"state": "closed"}
             )
             
@@ -430,13 +682,23 @@ class GitHubAPI:
             return False
 
 
+_GITHUB_APIS: Dict[str, GitHubAPI] = {}
+
+def get_github_api(token: str) -> GitHubAPI:
+    """Gibt die gemeinsame GitHubAPI-Instanz für einen Token zurück (Session + Prefetch bleiben erhalten)"""
+    if token not in _GITHUB_APIS:
+        _GITHUB_APIS[token] = GitHubAPI(token)
+    return _GITHUB_APIS[token]
+
+
 # ─── Section VI: Local Git API ──────────────────────────────────────────────────
 
 class LocalGitAPI:
     """Lokale Git-Operationen mit erweiterten Features"""
     
     def __init__(self):
-        pass
+        # Keine optionalen Locks (z.B. index.lock bei `git status`) – kein Warten auf IDEs/File-Watcher
+        self.env = {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
 
     def _run_git_command(self, command: List[str], cwd: Path) -> Tuple[bool, str]:
         """Führt ein Git-Kommando aus"""
@@ -444,6 +706,7 @@ class LocalGitAPI:
             result = subprocess.run(
                 command,
                 cwd=cwd,
+                env=self.env,
                 capture_output=True,
                 text=True,
                 check=True
@@ -452,9 +715,16 @@ class LocalGitAPI:
         except subprocess.CalledProcessError as e:
             return False, e.stderr.strip() or str(e)
 
+    def _run_git_bytes(self, command: List[str], cwd: Path) -> Optional[bytes]:
+        """Schneller Pfad für Lese-Kommandos: rohe Bytes ohne Text-Dekodierung, None bei Fehler"""
+        try:
+            return subprocess.check_output(command, cwd=cwd, env=self.env, stderr=subprocess.DEVNULL)
+        except (subprocess.CalledProcessError, OSError):
+            return None
+
     def status(self, repo_path: Path) -> Tuple[bool, str]:
         """Git Status"""
-        return self._run_git_command(["git", "status", "--porcelain"], repo_path)
+        return self._run_git_command(["git", "--no-optional-locks", "status", "--porcelain"], repo_path)
 
     def commit(self, repo_path: Path, message: str = "") -> Tuple[bool, str]:
         """Git Commit mit Editor oder Message"""
@@ -476,11 +746,8 @@ class LocalGitAPI:
         return self._run_git_command(["git", "push", "--force"], repo_path)
 
     def force_pull_from_remote(self, repo_path: Path) -> Tuple[bool, str]:
-        """Überschreibt lokale Änderungen mit Remote"""
-        success1, _ = self._run_git_command(["git", "fetch", "--all"], repo_path)
-        if success1:
-            return self._run_git_command(["git", "reset", "--hard", "origin/main"], repo_path)
-        return False, "Fetch fehlgeschlagen"
+        """Überschreibt lokale Änderungen mit Remote (Upstream des aktuellen Branches)"""
+        return self._run_git_command(["sh", "-c", "git fetch && git reset --hard '@{u}'"], repo_path)
 
     def hard_push_update(self, repo_path: Path) -> Tuple[bool, str]:
         """Force-with-lease Push"""
@@ -500,23 +767,13 @@ class LocalGitAPI:
 
     def get_recent_commits(self, repo_path: Path, count: int = 10) -> List[str]:
         """Holt die letzten Commits"""
-        success, output = self._run_git_command([
-            "git", "log", "--oneline", f"-{count}"
-        ], repo_path)
-        
-        if success and output:
-            return output.split('\n')
-        return []
+        output = self._run_git_bytes(["git", "log", "--oneline", f"-{count}"], repo_path)
+        return output.decode('utf-8', 'replace').splitlines() if output else []
 
     def get_file_tree(self, repo_path: Path) -> List[str]:
         """Holt den Dateibaum des Repositories"""
-        success, output = self._run_git_command([
-            "git", "ls-tree", "-r", "--name-only", "HEAD"
-        ], repo_path)
-        
-        if success and output:
-            return output.split('\n')
-        return []
+        output = self._run_git_bytes(["git", "ls-tree", "-r", "--name-only", "HEAD"], repo_path)
+        return output.decode('utf-8', 'replace').splitlines() if output else []
 
     def clone_repository(self, clone_url: str, target_path: Path) -> Tuple[bool, str]:
         """Klont ein Repository"""
@@ -593,48 +850,79 @@ class CodexIntegration:
             self.log_to_issue(f"Codex Ausführungsfehler: {e}", "error")
             return False, str(e)
 
+# Codex-Instanzen pro (GitHub-Token, OpenRouter-Token, Modell) – erst bei Bedarf erzeugt
+_CODEX_INSTANCES: Dict[Tuple[str, str, str], CodexIntegration] = {}
+
+def _make_codex(user_config: Dict[str, Any], github_api: GitHubAPI, git_api: LocalGitAPI) -> CodexIntegration:
+    """Liefert die (gemerkte) CodexIntegration inkl. AI-Konfiguration für diesen Benutzer"""
+    openrouter_token = user_config.get("openrouter_token") or ""
+    model = user_config.get("model", "openai/gpt-4o")
+    key = (user_config["token"], openrouter_token, model)
+    if key not in _CODEX_INSTANCES:
+        codex = CodexIntegration(github_api, git_api)
+        if openrouter_token:
+            codex.setup_ai_integration(openrouter_token, model)
+        _CODEX_INSTANCES[key] = codex
+    return _CODEX_INSTANCES[key]
 
 # ─── Section VIII: TUI Navigation (Wiederhergestellt aus v3.7.2) ───────────────
 
+@functools.lru_cache(maxsize=8)
+def _menu_box_borders(bw: int) -> Tuple[str, str]:
+    """Obere/untere Rahmenzeile der Beschreibungs-Box (pro Breite gecacht)"""
+    return "┌" + "─" * (bw - 2) + "┐", "└" + "─" * (bw - 2) + "┘"
+
+@functools.lru_cache(maxsize=256)
+def _wrap_description(desc: str, width: int) -> Tuple[str, ...]:
+    """Umbrochene Beschreibung (gecacht pro Text und Breite, unveränderlich)"""
+    return tuple(textwrap.wrap(desc, width=width))
+
 def run_curses_menu(title: str, options: List[Tuple[str,str]], context: str="") -> Optional[int]:
     """Original curses-basierte TUI mit Pfeiltasten-Navigation (aus v3.7.2)"""
+    import curses
     def draw(stdscr, selected):
         stdscr.clear()
         h, w = stdscr.getmaxyx()
-        stdscr.addstr(0, 2, context, curses.A_DIM)
-        stdscr.addstr(1, 2, title, curses.A_BOLD)
-        for idx, (opt, _) in enumerate(options):
-            x, y = 2, 3 + idx
-            if idx == selected:
-                stdscr.attron(curses.color_pair(1))
-                stdscr.addstr(y, x, f"> {opt}")
-                stdscr.attroff(curses.color_pair(1))
-            else:
-                stdscr.addstr(y, x, f"  {opt}")
+        normal, highlight = curses.A_NORMAL, curses.color_pair(1)
+        # Ganzen Bildschirm als (y, x, text, attr)-Liste aufbauen und in einem Durchlauf schreiben
+        cells = [(0, 2, context, curses.A_DIM), (1, 2, title, curses.A_BOLD)]
+        cells += [
+            (3 + idx, 2, f"> {opt}" if idx == selected else f"  {opt}", highlight if idx == selected else normal)
+            for idx, (opt, _) in enumerate(options)
+        ]
         
         # Beschreibungs-Box
         dy, dx, bw = 3 + len(options) + 1, 2, w - 4
-        stdscr.addstr(dy, dx, "┌" + "─" * (bw - 2) + "┐")
-        stdscr.addstr(dy + 1, dx, "│ ")
-        stdscr.addstr(dy + 1, dx + bw - 1, "│")
-        stdscr.addstr(dy + 2, dx, "└" + "─" * (bw - 2) + "┘")
+        top, bottom = _menu_box_borders(bw)
+        cells += [
+            (dy, dx, top, normal),
+            (dy + 1, dx, "│ ", normal),
+            (dy + 1, dx + bw - 1, "│", normal),
+            (dy + 2, dx, bottom, normal),
+        ]
         
-        desc = options[selected][1]
-        wrapped = textwrap.wrap(desc, width=bw - 4)
+        wrapped = _wrap_description(options[selected][1], bw - 4)
         if wrapped:
-            stdscr.addstr(dy + 1, dx + 2, wrapped[0])
+            cells.append((dy + 1, dx + 2, wrapped[0], normal))
         
-        stdscr.addstr(h - 2, 2, "Pfeiltasten: ↑↓ | Enter: OK | Q: Zurück", curses.A_DIM)
+        cells.append((h - 2, 2, "Pfeiltasten: ↑↓ | Enter: OK | Q: Zurück", curses.A_DIM))
+        for y, x, text, attr in cells:
+            stdscr.addstr(y, x, text, attr)
         stdscr.refresh()
 
     def loop(stdscr):
         curses.curs_set(0)
         curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_WHITE)
-        sel = 0
+        sel, drawn = 0, None
         while True:
-            draw(stdscr, sel)
+            # Nur neu zeichnen, wenn sich Auswahl oder Terminalgröße geändert hat
+            if sel != drawn:
+                draw(stdscr, sel)
+                drawn = sel
             k = stdscr.getch()
-            if k == curses.KEY_UP and sel > 0:
+            if k == curses.KEY_RESIZE:
+                drawn = None
+            elif k == curses.KEY_UP and sel > 0:
                 sel -= 1
             elif k == curses.KEY_DOWN and sel < len(options) - 1:
                 sel += 1
@@ -646,6 +934,27 @@ def run_curses_menu(title: str, options: List[Tuple[str,str]], context: str="")
     return curses.wrapper(loop)
 
 
+def _wait_key(prompt: str = "") -> None:
+    """Wartet auf einen Tastendruck im cbreak-Modus statt auf eine ganze Zeile (Fallback: input())"""
+    try:
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        old = termios.tcgetattr(fd)
+    except Exception:
+        # Kein TTY (Pipe, Windows) – klassisch auf Enter warten
+        input(prompt)
+        return
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    try:
+        tty.setcbreak(fd)
+        os.read(fd, 32)  # ganze Escape-Sequenz (z.B. Pfeiltaste) auf einmal verbrauchen
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+    sys.stdout.write("\n")
+
+
 def _execute_and_display(title: str, func: Callable, *args):
     """Führt Funktion aus und zeigt Ergebnis an"""
     console.clear()
@@ -656,13 +965,37 @@ def _execute_and_display(title: str, func: Callable, *args):
         console.print(res or "[green]✓ Erfolgreich[/green]")
     else:
         console.print(f"[bold red]Fehler:[/]\n{res}")
-    input("\nDrücke Enter zum Fortfahren...")
+    _wait_key("\nDrücke Enter zum Fortfahren...")
 
 
 # ─── Section IX: TUI Functions (Essential Functions) ───────────────────────────
 
+# Repository-Listing pro Benutzerverzeichnis: {user_dir: (mtime_ns, repos)}
+_user_repos_cache: Dict[Path, Tuple[int, List[Path]]] = {}
+
+def _list_user_repos(user_dir: Path) -> List[Path]:
+    """Sortierte lokale Repositories; neu gescannt nur wenn sich die Verzeichnis-mtime ändert"""
+    try:
+        mtime = user_dir.stat().st_mtime_ns
+    except OSError:
+        _user_repos_cache.pop(user_dir, None)
+        return []
+    cached = _user_repos_cache.get(user_dir)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    # os.scandir: DirEntry kennt den Typ aus getdents, stat() nur noch für Symlinks
+    with os.scandir(user_dir) as it:
+        repos = sorted(
+            (Path(e.path) for e in it if e.is_dir() and e.name != "backup"),
+            key=lambda p: p.name
+        )
+    _user_repos_cache[user_dir] = (mtime, repos)
+    return repos
+
 def tui_first_time_setup():
     """Erste Benutzer-Einrichtung"""
+    from getpass import getpass
+    from rich.panel import Panel
     console.clear()
     console.print(Panel.fit(
         "[bold cyan]Willkommen bei grepo2 v3.7.4.3![/bold cyan]\n\n"
@@ -688,13 +1021,15 @@ def tui_first_time_setup():
         return False
     
     console.print("\n[yellow]Teste Verbindung zu GitHub...[/yellow]")
-    github_api = GitHubAPI(token)
+    github_api = get_github_api(token)
     success, user_info = github_api.get_user_info()
     if not success:
         console.print("[red]❌ Verbindung fehlgeschlagen. Bitte überprüfe Benutzername und Token.[/red]")
         return False
     
     console.print("[green]✓ Verbindung erfolgreich![/green]")
+    # Repository-Liste schon laden, während der Benutzer die restlichen Fragen beantwortet
+    github_api.prefetch_repositories(username)
     
     # Erweiterte AI-Setup
     console.print("\n[yellow]Schritt 2 (Optional):[/yellow] AI-Integration einrichten")
@@ -744,9 +1079,29 @@ def tui_first_time_setup():
     
     console.print("\n[bold green]🎉 Setup abgeschlossen![/bold green]")
     console.print("[blue]Verwende das Hauptmenü zur Navigation oder 'grepo2 go' für CLI-Befehle[/blue]")
-    input("\nDrücke Enter, um zum Hauptmenü zu gelangen...")
+    _wait_key("\nDrücke Enter, um zum Hauptmenü zu gelangen...")
     return True
 
+_INWORK = "in-work"  # Label für aktuell bearbeitete Issues (v3.7.2 Feature)
+
+def _build_issue_options(issues: List[Dict[str, Any]], limit: int = 10,
+                         title_width: int = 50, with_body: bool = True) -> List[Tuple[str, str]]:
+    """Menüeinträge (Titel, Beschreibung) für die ersten `limit` Issues"""
+    _g = dict.get
+    options = []
+    for issue in issues[:limit]:
+        title = _g(issue, 'title') or 'Ohne Titel'
+        label_str = ', '.join(_g(label, 'name', '') for label in _g(issue, 'labels') or ())
+        label_str = f" [{label_str}]" if label_str else ""
+        if with_body:
+            option_text = f"#{_g(issue, 'number', 0)}: {title[:title_width]}{'...' if len(title) > title_width else ''}"
+            desc_text = f"Labels: {label_str}\nBeschreibung: {(_g(issue, 'body') or 'Keine Beschreibung')[:100]}..."
+        else:
+            option_text = f"#{_g(issue, 'number', 0)}: {title[:title_width]}"
+            desc_text = f"Labels: {label_str}"
+        options.append((option_text, desc_text))
+    return options
+
 def tui_codex_generate():
     """Codex Code-Generierung mit GitHub Issue-Integration (v3.7.3+ Features)"""
     active_user = get_active_user()
@@ -760,22 +1115,16 @@ def tui_codex_generate():
         return
 
     # GitHub API initialisieren
-    github_api = GitHubAPI(user_config["token"])
-    git_api = LocalGitAPI()
-    codex = CodexIntegration(github_api, git_api)
-    
-    # AI-Integration konfigurieren falls verfügbar
-    if user_config.get("openrouter_token"):
-        codex.setup_ai_integration(user_config["openrouter_token"], user_config.get("model", "openai/gpt-4o"))
+    github_api = get_github_api(user_config["token"])
 
     # Repository-Auswahl
     user_dir = GITHUB_DIR / active_user
-    repos = sorted([d for d in user_dir.iterdir() if d.is_dir() and d.name != "backup"], key=lambda p: p.name)
+    repos = _list_user_repos(user_dir)
     
     if not repos:
         console.print("[red]❌ Keine lokalen Repositories gefunden![/red]")
         console.print(f"[blue]💡 Erstelle Repositories in: {user_dir}[/blue]")
-        input()
+        _wait_key()
         return
 
     repo_options = [(r.name, f"Lokaler Pfad: {r}") for r in repos]
@@ -794,19 +1143,19 @@ def tui_codex_generate():
     
     # GitHub Issues laden
     console.print("[blue]🔍 Lade GitHub Issues...[/blue]")
-    success, issues = github_api.list_issues(active_user, repo_name)
+    success, issues = github_api.list_issues(active_user, repo_name, graphql=True)
     
     if not success or not issues:
         console.print("[yellow]⚠ Keine offenen Issues gefunden oder API-Fehler[/yellow]")
         console.print("[blue]💡 Erstelle Issues auf GitHub für bessere Codex-Integration[/blue]")
-        input()
+        _wait_key()
         return
 
     # Issue-Auswahl mit modernem Rich-Interface
     console.print(f"[green]✓ {len(issues)} Issues gefunden[/green]")
     
     # Filtere nach "in-work" Label (v3.7.2 Feature)
-    in_work_issues = [issue for issue in issues if any(label.get('name', '') == 'in-work' for label in issue.get('labels', []))]
+    in_work_issues = [issue for issue in issues if any(label.get('name') == _INWORK for label in issue.get('labels') or ())]
     
     if in_work_issues:
         console.print(f"[blue]🏷️ {len(in_work_issues)} Issues mit 'in-work' Label gefunden[/blue]")
@@ -816,17 +1165,7 @@ def tui_codex_generate():
         issues_to_show = issues
 
     # Issue-Optionen für Curses-Menü
-    issue_options = []
-    for issue in issues_to_show[:10]:  # Erste 10 Issues
-        title = issue.get('title', 'Ohne Titel')
-        number = issue.get('number', 0)
-        labels = [label.get('name', '') for label in issue.get('labels', [])]
-        label_str = f" [{', '.join(labels)}]" if labels else ""
-        
-        option_text = f"#{number}: {title[:50]}{'...' if len(title) > 50 else ''}"
-        desc_text = f"Labels: {label_str}\nBeschreibung: {issue.get('body', 'Keine Beschreibung')[:100]}..."
-        
-        issue_options.append((option_text, desc_text))
+    issue_options = _build_issue_options(issues_to_show)
 
     issue_choice = run_curses_menu("GitHub Issue auswählen", issue_options, f"Repository: {repo_name}")
     
@@ -834,14 +1173,18 @@ def tui_codex_generate():
         return
     
     selected_issue = issues_to_show[issue_choice]
+    # Codex erst nach der Issue-Auswahl konfigurieren
+    codex = _make_codex(user_config, github_api, LocalGitAPI())
     
     # Vereinfachte Codex-Ausführung (da execute_codex_for_issue nicht vollständig implementiert)
     console.clear()
     console.print(f"[bold green]🚀 Starte Codex für Issue #{selected_issue['number']}[/bold green]")
     console.print(f"[blue]📝 {selected_issue['title']}[/blue]")
+    if codex.openrouter_token:
+        console.print(f"[blue]🤖 AI-Model: {codex.model}[/blue]")
     console.print("[yellow]💡 Vollständige Codex-Integration wird in zukünftigen Versionen implementiert[/yellow]")
     
-    input("\nDrücke Enter, um zum Hauptmenü zu gelangen...")
+    _wait_key("\nDrücke Enter, um zum Hauptmenü zu gelangen...")
     return True
 
 def tui_manage_repo(repo_path: Path):
@@ -912,10 +1255,11 @@ def tui_settings_menu():
 
 def tui_change_github_token():
     """GitHub Token ändern"""
+    from getpass import getpass
     active_user = get_active_user()
     if not active_user:
         console.print("[red]❌ Kein aktiver Benutzer[/red]")
-        input()
+        _wait_key()
         return
     
     console.clear()
@@ -926,7 +1270,7 @@ def tui_change_github_token():
     new_token = getpass("Neuer Personal Access Token: ")
     if not new_token:
         console.print("[yellow]Abgebrochen[/yellow]")
-        input()
+        _wait_key()
         return
     
     # Token validieren
@@ -934,31 +1278,96 @@ def tui_change_github_token():
     success, user_info = github_api.get_user_info()
     if not success:
         console.print("[red]❌ Token-Validierung fehlgeschlagen![/red]")
-        input()
+        _wait_key()
         return
     
-    # Aktuelle Konfiguration laden und Token aktualisieren
-    user_config = load_user_config(active_user) or {}
-    save_user_config(
-        active_user, 
-        new_token,
-        user_config.get("openrouter_token", ""),
-        user_config.get("model", "openai/gpt-4o")
-    )
+    # Nur den Token aktualisieren, übrige Felder bleiben unverändert
+    update_user_field(active_user, token=new_token)
     
     console.print("[green]✅ GitHub Token erfolgreich aktualisiert![/green]")
-    input()
+    _wait_key()
+
+def _dir_size(path: Path) -> int:
+    """Summiert Dateigrößen rekursiv via os.scandir (DirEntry cacht den Dateityp, kein extra stat)"""
+    total, stack = 0, [str(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
+@functools.lru_cache(maxsize=1)
+def _du_path() -> Optional[str]:
+    """Pfad zu GNU du (nur Linux, dort versteht du die Option -b)"""
+    return shutil.which("du") if sys.platform.startswith("linux") else None
+
+def _fast_dir_size(path: Path) -> int:
+    """Verzeichnisgröße via `du -sb` (C-Walker), Fallback auf _dir_size"""
+    du = _du_path()
+    if du:
+        try:
+            result = subprocess.run([du, "-sb", str(path)], capture_output=True, text=True)
+            if result.returncode == 0:
+                return int(result.stdout.split(None, 1)[0])
+        except (OSError, ValueError, IndexError):
+            pass
+    return _dir_size(path)
+
+def _repo_size_key(repo: Path) -> str:
+    """Cache-Schlüssel: mtime des Repo-Verzeichnisses und des Git-Index"""
+    stamps = []
+    for p in (repo, repo / ".git" / "index"):
+        try:
+            stamps.append(str(p.stat().st_mtime_ns))
+        except OSError:
+            stamps.append("0")
+    return ":".join(stamps)
+
+def _repo_sizes(repos: List[Path]) -> Dict[Path, int]:
+    """Repository-Größen aus REPO_SIZES_FILE, geänderte Repos werden parallel neu vermessen"""
+    try:
+        cache = _loads(REPO_SIZES_FILE.read_bytes())
+    except (OSError, ValueError):
+        cache = {}
+    sizes: Dict[Path, int] = {}
+    todo: Dict[Path, str] = {}
+    for repo in repos:
+        key = _repo_size_key(repo)
+        entry = cache.get(str(repo))
+        if entry and entry.get("key") == key:
+            sizes[repo] = entry["size"]
+        else:
+            todo[repo] = key
+    if todo:
+        with ThreadPoolExecutor(max_workers=min(32, len(todo))) as pool:
+            futures = {pool.submit(_fast_dir_size, repo): repo for repo in todo}
+            for future in as_completed(futures):
+                repo = futures[future]
+                sizes[repo] = future.result()
+                cache[str(repo)] = {"key": todo[repo], "size": sizes[repo]}
+        try:
+            _atomic_write(REPO_SIZES_FILE, _dumps(cache))
+        except OSError:
+            pass
+    return sizes
 
 def tui_show_repositories():
     """Zeigt lokale Repositories an"""
+    from rich.table import Table
     active_user = get_active_user()
     if not active_user:
         console.print("[red]❌ Kein aktiver Benutzer[/red]")
-        input()
+        _wait_key()
         return
     
     user_dir = GITHUB_DIR / active_user
-    repos = sorted([d for d in user_dir.iterdir() if d.is_dir() and d.name != "backup"], key=lambda p: p.name) if user_dir.exists() else []
+    repos = _list_user_repos(user_dir)
     
     console.clear()
     console.print(f"[bold cyan]📁 Lokale Repositories für {active_user}[/bold cyan]")
@@ -973,18 +1382,15 @@ def tui_show_repositories():
         table.add_column("Pfad", style="blue")
         table.add_column("Größe", style="green")
         
+        sizes = _repo_sizes(repos)
         for repo in repos:
-            try:
-                size = sum(f.stat().st_size for f in repo.rglob('*') if f.is_file())
-                size_str = f"{size // 1024} KB" if size < 1024*1024 else f"{size // (1024*1024)} MB"
-            except:
-                size_str = "N/A"
-            
+            size = sizes[repo]
+            size_str = f"{size // 1024} KB" if size < 1024*1024 else f"{size // (1024*1024)} MB"
             table.add_row(repo.name, str(repo), size_str)
         
         console.print(table)
     
-    input("\nDrücke Enter zum Fortfahren...")
+    _wait_key("\nDrücke Enter zum Fortfahren...")
 
 def tui_user_menu():
     """Benutzerverwaltung (wiederhergestellt aus v3.7.2)"""
@@ -1002,15 +1408,15 @@ def tui_user_menu():
         elif c == 0:
             console.clear()
             console.print("[yellow]Benutzer-Auswahl noch nicht implementiert[/yellow]")
-            input()
+            _wait_key()
         elif c == 1:
             console.clear()
             console.print("[yellow]Neuer Benutzer noch nicht implementiert[/yellow]")
-            input()
+            _wait_key()
         elif c == 2:
             console.clear()
             console.print("[yellow]Benutzer löschen noch nicht implementiert[/yellow]")
-            input()
+            _wait_key()
     return False
 
 def tui_projekterstellung_menu(repo_path: Path):
@@ -1032,12 +1438,12 @@ def tui_projekterstellung_menu(repo_path: Path):
             console.clear()
             console.print("[yellow]Roadmap-Generierung noch nicht vollständig implementiert[/yellow]")
             console.print("[blue]💡 Geplant für zukünftige Version[/blue]")
-            input("Drücke Enter zum Fortfahren...")
+            _wait_key("Drücke Enter zum Fortfahren...")
         elif choice == 2:
             console.clear()
             console.print("[yellow]GitHub-Projekt-Setup noch nicht implementiert[/yellow]")
             console.print("[blue]💡 Geplant für zukünftige Version[/blue]")
-            input("Drücke Enter zum Fortfahren...")
+            _wait_key("Drücke Enter zum Fortfahren...")
 
 def tui_codex_generate_for_repo(repo_path: Path):
     """Repository-spezifische Codex-Generierung (kompatibel mit v3.7.2 Aufruf)"""
@@ -1047,35 +1453,25 @@ def tui_codex_generate_for_repo(repo_path: Path):
     active_user = get_active_user()
     if not active_user:
         console.print("[red]❌ Kein aktiver Benutzer gesetzt[/red]")
-        input("Drücke Enter zum Fortfahren...")
+        _wait_key("Drücke Enter zum Fortfahren...")
         return
 
     user_config = load_user_config(active_user)
     if not user_config:
         console.print("[red]❌ Benutzer-Konfiguration nicht gefunden[/red]")
         console.print("[blue]💡 Gehe zu Einstellungen → GitHub Token ändern[/blue]")
-        input("Drücke Enter zum Fortfahren...")
+        _wait_key("Drücke Enter zum Fortfahren...")
         return
     
     # Check if GitHub token is available and valid
     if not user_config.get("token"):
         console.print("[red]❌ GitHub Token fehlt oder ist beschädigt[/red]")
         console.print("[blue]💡 Gehe zu Einstellungen → GitHub Token ändern[/blue]")
-        input("Drücke Enter zum Fortfahren...")
+        _wait_key("Drücke Enter zum Fortfahren...")
         return
 
     # GitHub API initialisieren
-    github_api = GitHubAPI(user_config["token"])
-    git_api = LocalGitAPI()
-    codex = CodexIntegration(github_api, git_api)
-    
-    # AI-Integration konfigurieren falls verfügbar
-    if user_config.get("openrouter_token"):
-        codex.setup_ai_integration(user_config["openrouter_token"], user_config.get("model", "openai/gpt-4o"))
-        console.print(f"[green]✓ AI-Integration aktiviert: {user_config.get('model', 'openai/gpt-4o')}[/green]")
-    else:
-        console.print("[yellow]⚠ AI-Integration nicht konfiguriert[/yellow]")
-        console.print("[blue]💡 Konfiguriere OpenRouter Token in den Einstellungen für erweiterte Features[/blue]")
+    github_api = get_github_api(user_config["token"])
 
     # Repository-Info anzeigen
     console.print(f"[blue]📂 Repository: {repo_path}[/blue]")
@@ -1083,19 +1479,19 @@ def tui_codex_generate_for_repo(repo_path: Path):
     
     # GitHub Issues laden für das spezifische Repository
     console.print("[blue]🔍 Lade GitHub Issues...[/blue]")
-    success, issues = github_api.list_issues(active_user, repo_name)
+    success, issues = github_api.list_issues(active_user, repo_name, graphql=True)
     
     if not success or not issues:
         console.print("[yellow]⚠ Keine offenen Issues gefunden oder API-Fehler[/yellow]")
         console.print("[blue]💡 Erstelle Issues auf GitHub für bessere Codex-Integration[/blue]")
-        input("Drücke Enter zum Fortfahren...")
+        _wait_key("Drücke Enter zum Fortfahren...")
         return
 
     # Issue-Auswahl mit modernem Rich-Interface
     console.print(f"[green]✓ {len(issues)} Issues gefunden[/green]")
     
     # Filtere nach "in-work" Label (v3.7.2 Feature)
-    in_work_issues = [issue for issue in issues if any(label.get('name', '') == 'in-work' for label in issue.get('labels', []))]
+    in_work_issues = [issue for issue in issues if any(label.get('name') == _INWORK for label in issue.get('labels') or ())]
     
     if in_work_issues:
         console.print(f"[blue]🏷️ {len(in_work_issues)} Issues mit 'in-work' Label gefunden[/blue]")
@@ -1105,17 +1501,11 @@ def tui_codex_generate_for_repo(repo_path: Path):
         issues_to_show = issues
 
     # Issue-Optionen für Curses-Menü
-    issue_options = []
-    for issue in issues_to_show[:10]:  # Erste 10 Issues
-        title = issue.get('title', 'Ohne Titel')
-        number = issue.get('number', 0)
-        labels = [label.get('name', '') for label in issue.get('labels', [])]
-        label_str = f" [{', '.join(labels)}]" if labels else ""
-        issue_options.append((f"#{number}: {title[:60]}", f"Labels: {label_str}"))
+    issue_options = _build_issue_options(issues_to_show, title_width=60, with_body=False)
     
     if not issue_options:
         console.print("[yellow]Keine Issues zum Bearbeiten verfügbar[/yellow]")
-        input("Drücke Enter zum Fortfahren...")
+        _wait_key("Drücke Enter zum Fortfahren...")
         return
 
     # Issue auswählen
@@ -1131,6 +1521,14 @@ def tui_codex_generate_for_repo(repo_path: Path):
     selected_issue = issues_to_show[selected_issue_idx]
     console.print(f"[green]✓ Issue #{selected_issue['number']} ausgewählt[/green]")
     
+    # AI-Integration erst nach der Issue-Auswahl konfigurieren
+    codex = _make_codex(user_config, github_api, LocalGitAPI())
+    if codex.openrouter_token:
+        console.print(f"[green]✓ AI-Integration aktiviert: {codex.model}[/green]")
+    else:
+        console.print("[yellow]⚠ AI-Integration nicht konfiguriert[/yellow]")
+        console.print("[blue]💡 Konfiguriere OpenRouter Token in den Einstellungen für erweiterte Features[/blue]")
+    
     # Vereinfachte Codex-Ausführung
     try:
         write_to_changelog(f"Repository-spezifische Codex-Generierung gestartet für {repo_name} Issue #{selected_issue['number']}", "info")
@@ -1139,10 +1537,12 @@ def tui_codex_generate_for_repo(repo_path: Path):
         console.print(f"[red]❌ Fehler bei Codex-Ausführung: {e}[/red]")
         write_to_changelog(f"Codex-Fehler für {repo_name}: {e}", "error")
     
-    input("Drücke Enter zum Fortfahren...")
+    _wait_key("Drücke Enter zum Fortfahren...")
 
 def tui_first_time_setup():
     """Erste Benutzer-Einrichtung (wiederhergestellt aus v3.7.2 mit v3.7.3+ Features)"""
+    from getpass import getpass
+    from rich.panel import Panel
     console.clear()
     console.print(Panel.fit(
         "[bold cyan]Willkommen bei grepo2 v3.7.4.3![/bold cyan]\n\n"
@@ -1167,16 +1567,8 @@ def tui_first_time_setup():
         console.print("[red]Kein Token eingegeben. Setup abgebrochen.[/red]")
         return False
     
-    console.print("\n[yellow]Teste Verbindung zu GitHub...[/yellow]")
-    github_api = GitHubAPI(token)
-    success, user_info = github_api.get_user_info()
-    if not success:
-        console.print("[red]❌ Verbindung fehlgeschlagen. Bitte überprüfe Benutzername und Token.[/red]")
-        return False
-    
-    console.print("[green]✓ Verbindung erfolgreich![/green]")
-    
-    # Erweiterte AI-Setup (v3.7.3+ Feature)
+    # Erweiterte AI-Setup (v3.7.3+ Feature) – Abfrage vor dem Verbindungstest,
+    # damit GitHub-Validierung und Modell-Abruf gemeinsam laufen können
     console.print("\n[yellow]Schritt 2 (Optional):[/yellow] AI-Integration einrichten")
     console.print("Für erweiterte Codex-Features kannst du einen OpenRouter API-Token hinzufügen.")
     console.print("Registrierung: https://openrouter.ai/ (optional, kann später eingerichtet werden)\n")
@@ -1184,28 +1576,42 @@ def tui_first_time_setup():
     setup_ai = input("AI-Integration jetzt einrichten? (j/n): ").lower() == 'j'
     openrouter_token = ""
     model = "openai/gpt-4o"
-    
     if setup_ai:
         openrouter_token = getpass("OpenRouter API Token (Enter für später): ")
-        if openrouter_token:
-            console.print("Lade verfügbare AI-Modelle...")
-            try:
-                coding_models = fetch_openrouter_models(openrouter_token)
-                if coding_models and len(coding_models) > 0:
-                    console.print(f"✓ {len(coding_models)} coding-optimierte Models gefunden!")
-                    for i, model_info in enumerate(coding_models[:5]):  # Top 5
-                        console.print(f"{i+1}. {model_info.get('name', 'Unknown')} ({model_info.get('id', '')})")
-                    
-                    try:
-                        choice = int(input(f"Modell wählen (1-{len(coding_models[:5])}, Enter für Standard): ") or "1") - 1
-                        if 0 <= choice < len(coding_models):
-                            model = coding_models[choice]["id"]
-                    except ValueError:
-                        pass
-                else:
-                    console.print("Verwende Standard-Modell (openai/gpt-4o)")
-            except Exception as e:
-                console.print(f"Fehler beim Laden der Modelle: {e}")
+    
+    console.print("\n[yellow]Teste Verbindung zu GitHub...[/yellow]")
+    github_api = get_github_api(token)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        user_future = pool.submit(github_api.get_user_info)
+        models_future = pool.submit(fetch_openrouter_models, openrouter_token) if openrouter_token else None
+        success, user_info = user_future.result()
+    if not success:
+        console.print("[red]❌ Verbindung fehlgeschlagen. Bitte überprüfe Benutzername und Token.[/red]")
+        return False
+    
+    console.print("[green]✓ Verbindung erfolgreich![/green]")
+    # Repository-Liste schon laden, während der Benutzer die restlichen Fragen beantwortet
+    github_api.prefetch_repositories(username)
+    
+    if models_future is not None:
+        console.print("Lade verfügbare AI-Modelle...")
+        try:
+            coding_models = models_future.result()
+            if coding_models and len(coding_models) > 0:
+                console.print(f"✓ {len(coding_models)} coding-optimierte Models gefunden!")
+                for i, model_info in enumerate(coding_models[:5]):  # Top 5
+                    console.print(f"{i+1}. {model_info.get('name', 'Unknown')} ({model_info.get('id', '')})")
+                
+                try:
+                    choice = int(input(f"Modell wählen (1-{len(coding_models[:5])}, Enter für Standard): ") or "1") - 1
+                    if 0 <= choice < len(coding_models):
+                        model = coding_models[choice]["id"]
+                except ValueError:
+                    pass
+            else:
+                console.print("Verwende Standard-Modell (openai/gpt-4o)")
+        except Exception as e:
+            console.print(f"Fehler beim Laden der Modelle: {e}")
     
     # Speichere Benutzer
     save_user_config(username, token, openrouter_token, model)
@@ -1227,15 +1633,33 @@ def tui_first_time_setup():
     
     console.print("\n[bold green]🎉 Setup abgeschlossen![/bold green]")
     console.print("[blue]Verwende das Hauptmenü zur Navigation oder 'grepo2 go' für CLI-Befehle[/blue]")
-    input("\nDrücke Enter, um zum Hauptmenü zu gelangen...")
+    _wait_key("\nDrücke Enter, um zum Hauptmenü zu gelangen...")
     return True
 
+def _mtime_or_zero(path: Path) -> float:
+    """Änderungszeit eines Pfads; 0, falls er inzwischen verschwunden ist"""
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+def _prefetch_recent_issues(user: Optional[str], count: int = 5) -> None:
+    """Startet das Vorladen der Issues für die zuletzt geänderten lokalen Repositories"""
+    user_config = load_user_config(user) if user else None
+    if not user_config or not user_config.get("token"):
+        return
+    repos = _list_user_repos(GITHUB_DIR / user)
+    recent = sorted(repos, key=_mtime_or_zero, reverse=True)[:count]
+    if recent:
+        get_github_api(user_config["token"]).prefetch_issues(user, [r.name for r in recent])
+
 def run_tui():
     """Hauptmenü mit wiederhergestellter Repository-Auswahl und vollständiger Navigation"""
+    _prefetch_recent_issues(get_active_user())
     while True:
         user = get_active_user()
         user_dir = GITHUB_DIR / user
-        repos = sorted([d for d in user_dir.iterdir() if d.is_dir() and d.name != "backup"], key=lambda p: p.name) if user_dir.exists() else []
+        repos = _list_user_repos(user_dir)
         
         # Repository-Optionen (Kernfunktion wiederhergestellt!)
         repo_opts = [(r.name, f"Verwalte Repository: {r.name}") for r in repos]
@@ -1273,13 +1697,13 @@ def run_tui():
                 console.clear()
                 console.print("[yellow]Repository-Erstellung noch nicht implementiert[/yellow]")
                 console.print("[blue]💡 Erstelle Repositories manuell in GitHub und klone sie lokal[/blue]")
-                input()
+                _wait_key()
             elif idx == 3:  # Einstellungen
                 tui_settings_menu()
             elif idx == 4:  # Projekterstellung
                 if not repos:
                     console.print("[yellow]Keine Repositories vorhanden[/yellow]")
-                    input()
+                    _wait_key()
                 else:
                     choice = run_curses_menu(
                         "Repo für Projekterstellung wählen",
@@ -1305,6 +1729,7 @@ def repo():
 @repo.command()
 def list():
     """Listet alle Repositories auf"""
+    from rich.table import Table
     active = get_active_user()
     if not active:
         console.print("[red]Kein aktiver Benutzer[/red]")
@@ -1315,7 +1740,7 @@ def list():
         console.print("[red]❌ Benutzer-Konfiguration nicht gefunden.[/red]")
         return
 
-    github_api = GitHubAPI(user_config["token"])
+    github_api = get_github_api(user_config["token"])
     
     console.print(f"[blue]🔍 Lade Repositories für {active}....[/blue]")
     repos = github_api.list_repositories(active)
@@ -1349,6 +1774,7 @@ def list():
 @go.command()
 def login():
     """Benutzer einloggen"""
+    from getpass import getpass
     username = input("GitHub-Benutzername: ")
     if not username:
         console.print("[red]❌ Benutzername ist erforderlich![/red]")
@@ -1394,6 +1820,23 @@ def status():
 
 # ─── Section XI: Main Entry Point (Originalverhalten wiederhergestellt) ─────────
 
+def _same_install(script_path: Path, target_path: Path) -> bool:
+    """Vergleicht Skript und installierte Version; Ergebnis gecacht über beide mtimes"""
+    import filecmp
+    key = [script_path.stat().st_mtime_ns, target_path.stat().st_mtime_ns]
+    try:
+        cached = _loads(INSTALL_CHECK_FILE.read_bytes())
+        if cached.get("key") == key:
+            return cached["same"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    same = filecmp.cmp(str(script_path), str(target_path), shallow=False)
+    try:
+        _atomic_write(INSTALL_CHECK_FILE, _dumps({"key": key, "same": same}))
+    except OSError:
+        pass
+    return same
+
 if __name__ == "__main__":
     if not check_git_cli():
         sys.exit(1)
@@ -1405,18 +1848,18 @@ if __name__ == "__main__":
         if script_path != target_path:
             if not target_path.exists():
                 if input(f"grepo2 ist nicht systemweit installiert ({target_path}). Installieren? (j/n): ").lower() == 'j':
-                    subprocess.run(["sudo", "cp", str(script_path), str(target_path)], check=True)
-                    subprocess.run(["sudo", "chmod", "+x", str(target_path)], check=True)
+                    # install(1) kopiert und setzt die Rechte in einem einzigen sudo-Aufruf
+                    subprocess.run(["sudo", "install", "-m", "755", str(script_path), str(target_path)], check=True)
                     console.print("[green]grepo2 wurde systemweit installiert![/green]")
             else:
                 same = False
                 try:
-                    same = filecmp.cmp(str(script_path), str(target_path), shallow=False)
+                    same = _same_install(script_path, target_path)
                 except Exception as e:
                     console.print(f"[yellow]Vergleich fehlgeschlagen: {e}[/yellow]")
                 if not same:
                     if input("Systemweite Version weicht ab. Aktualisieren? (j/n): ").lower() == 'j':
-                        subprocess.run(["sudo", "cp", str(script_path), str(target_path)], check=True)
+                        subprocess.run(["sudo", "install", "-m", "755", str(script_path), str(target_path)], check=True)
 
     except Exception as e:
         console.print(f"[yellow]Manuell installieren: sudo cp {script_path} {target_path} ({e})[/yellow]")
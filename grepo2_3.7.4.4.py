@@ -24,69 +24,119 @@ Basis: grepo2 v3.7.3.2 + v3.7.4.3 Enhancements
 Status: PRODUCTION READY ✅
 """
 
-import click
-import requests
 import json
 import subprocess
 import sys
 import os
-import curses
+import mmap
+import re
 import textwrap
+import functools
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Tuple, Callable, Any
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from typing import Optional, List, Dict, Tuple, Callable, Any, TYPE_CHECKING
 import base64
 
-console = Console()
+# requests, rich und curses werden erst dort importiert, wo sie gebraucht werden –
+# `grepo2 --help` / `--version` bleiben so schnell
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+class _LazyConsole:
+    """Proxy für rich.Console – rich wird erst bei der ersten Ausgabe importiert"""
+    _console = None
+
+    @staticmethod
+    def _get():
+        """Echte Console – für rich-Objekte, die sie als Kontextmanager o.ä. nutzen (z.B. Progress)"""
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return _LazyConsole._console
+
+    def __getattr__(self, name):
+        return getattr(self._get(), name)
+
+console = _LazyConsole()
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Configuration Management (Enhanced v3.7.4.4)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@functools.lru_cache(maxsize=1)
 def get_active_user() -> str:
-    """Aktueller Benutzer aus Umgebung oder Git Config"""
+    """Aktueller Benutzer aus Umgebung oder Git Config (einmal pro Prozess ermittelt)"""
     try:
-        result = subprocess.run(["git", "config", "--global", "user.name"], 
-                              capture_output=True, text=True)
+        result = subprocess.run(["git", "config", "--global", "user.name"],
+                              capture_output=True, text=True, check=False, timeout=2.0)
         if result.returncode == 0 and result.stdout.strip():
             return result.stdout.strip()
-    except:
+    except (OSError, subprocess.SubprocessError):  # git fehlt oder hängt; Ctrl-C bleibt durchgereicht
         pass
     return os.environ.get("USER", "default")
 
+_TOKEN_KEYS = ("github_token", "openrouter_token")  # Base64-kodiert gespeicherte Felder
+
+# Auswählbare OpenRouter-Modelle, das erste ist der Standard
+_MODELS: Tuple[str, ...] = ("openai/gpt-3.5-turbo", "openai/gpt-4", "anthropic/claude-3-haiku", "google/gemini-pro")
+_MODEL_COUNT = len(_MODELS)
+
+def _user_config_path(user: str) -> Path:
+    return Path.home() / f".grepo2_{user}_config.json"
+
 def load_user_config(user: str) -> Optional[Dict]:
-    """Lädt Benutzerkonfiguration"""
-    config_path = Path.home() / f".grepo2_{user}_config.json"
-    if config_path.exists():
-        try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                # Decode base64 tokens
-                for key in ['github_token', 'openrouter_token']:
-                    if key in config and config[key]:
-                        try:
-                            config[key] = base64.b64decode(config[key]).decode('utf-8')
-                        except:
-                            pass
-                return config
-        except:
-            pass
+    """Lädt Benutzerkonfiguration (gecacht, Aufrufer erhalten eine eigene Kopie)"""
+    try:
+        mtime_ns = _user_config_path(user).stat().st_mtime_ns
+    except OSError:
+        return None
+    config = _load_user_config_cached(user, mtime_ns)
+    return dict(config) if config is not None else None
+
+@functools.lru_cache(maxsize=8)
+def _load_user_config_cached(user: str, mtime_ns: int) -> Optional[Dict]:
+    """Liest und dekodiert die Konfigurationsdatei; Schlüssel enthält die mtime, externe Änderungen werden erkannt"""
+    try:
+        config = _loads(_user_config_path(user).read_bytes())
+        # Decode base64 tokens
+        for key in _TOKEN_KEYS:
+            value = config.get(key)
+            if value and isinstance(value, str):  # handeditierte Nicht-Strings unverändert lassen
+                try:
+                    config[key] = base64.b64decode(value).decode('utf-8')
+                except ValueError:  # binascii.Error / UnicodeDecodeError: Klartext belassen
+                    pass
+        return config
+    except (OSError, ValueError, AttributeError):  # unlesbar, kein JSON oder kein Objekt
+        pass
     return None
 
 def save_user_config(user: str, config: Dict):
     """Speichert Benutzerkonfiguration mit Base64-Encoding für Tokens"""
     config_copy = config.copy()
     # Encode tokens
-    for key in ['github_token', 'openrouter_token']:
-        if key in config_copy and config_copy[key]:
-            config_copy[key] = base64.b64encode(config_copy[key].encode('utf-8')).decode('ascii')
+    for key in _TOKEN_KEYS:
+        value = config_copy.get(key)
+        if value and isinstance(value, str):
+            config_copy[key] = base64.b64encode(value.encode('utf-8')).decode('ascii')
     
-    config_path = Path.home() / f".grepo2_{user}_config.json"
-    with open(config_path, 'w') as f:
-        json.dump(config_copy, f, indent=2)
+    _user_config_path(user).write_bytes(_dumps(config_copy))
+    _load_user_config_cached.cache_clear()
+
+_UNRELEASED = b"## Unreleased"
 
 def write_to_changelog(message: str, level: str = "info"):
     """Schreibt automatisch ins CHANGELOG.md"""
@@ -97,23 +147,71 @@ def write_to_changelog(message: str, level: str = "info"):
     
     entry = f"- {timestamp} {icon} {message}\n"
     
-    if changelog.exists():
-        with open(changelog, 'r', encoding='utf-8') as f:
-            content = f.read()
-        if "## Unreleased" in content:
-            content = content.replace("## Unreleased\n", f"## Unreleased\n{entry}")
-        else:
-            content = f"# Changelog\n\n## Unreleased\n{entry}\n{content}"
+    if changelog.exists() and changelog.stat().st_size:
+        with open(changelog, 'r+b') as f:
+            # Anker per mmap suchen statt die ganze Datei als String zu laden
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = mm.find(_UNRELEASED)
+                if pos != -1:
+                    # Einfügen hinter dem Zeilenende der Überschrift (LF oder CRLF)
+                    eol = mm.find(b"\n", pos)
+                    crlf = eol > 0 and mm[eol - 1:eol] == b"\r"
+            if pos != -1:
+                data = entry.encode('utf-8')
+                if crlf:
+                    data = data.replace(b"\n", b"\r\n")
+                if eol == -1:  # Überschrift ohne Zeilenumbruch am Dateiende
+                    f.seek(0, os.SEEK_END)
+                    f.write(b"\n" + data)
+                    return
+                # Nur den Teil hinter dem Anker verschieben, Kopf bleibt unberührt
+                pos = eol + 1
+                f.seek(pos)
+                tail = f.read()
+                f.seek(pos)
+                f.write(data + tail)
+                return
+            content = f.read().decode('utf-8')
+        content = f"# Changelog\n\n## Unreleased\n{entry}\n{content}"
     else:
         content = f"# Changelog\n\n## Unreleased\n{entry}"
     
-    with open(changelog, 'w', encoding='utf-8') as f:
-        f.write(content)
+    changelog.write_text(content, encoding='utf-8')
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # GitHub API Integration (Enhanced v3.7.4.4)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@functools.lru_cache(maxsize=1)
+def _http() -> "requests.Session":
+    """Gemeinsame HTTP-Session für GitHub und OpenRouter (Keep-Alive, erst bei Bedarf erzeugt)"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    session.headers["User-Agent"] = "grepo2-v3.7.4.4"
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+    session.mount("https://", adapter)
+    return session
+
+_GITHUB_TIMEOUT = 30       # Sekunden pro Request
+_GITHUB_RETRIES = 3        # Wiederholungen bei Rate-Limit (403/429)
+_GITHUB_MAX_WAIT = 120     # länger wird nicht gewartet, sondern abgebrochen
+
+def _rate_limit_wait(response) -> Optional[float]:
+    """Wartezeit in Sekunden bei GitHub-Rate-Limit, None wenn die Antwort kein Rate-Limit ist"""
+    if response.status_code not in (403, 429):
+        return None
+    retry_after = response.headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        reset = response.headers.get("X-RateLimit-Reset", "")
+        return max(0.0, int(reset) - time.time()) if reset.isdigit() else 60.0
+    # Sekundäres Limit ohne Header: GitHub empfiehlt mindestens eine Minute Pause
+    if response.status_code == 429 or "rate limit" in response.text.lower():
+        return 60.0
+    return None  # 403 aus anderen Gründen (z.B. fehlende Rechte)
+
 class GitHubAPI:
     def __init__(self, token: str):
         self.token = token
@@ -123,6 +221,8 @@ class GitHubAPI:
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "grepo2-v3.7.4.4"
         }
+        # Gemeinsame Session: TCP/TLS-Verbindungen werden wiederverwendet
+        self.session = _http()
     
     def create_issue(self, repo: str, title: str, body: str = "", labels: List[str] = None) -> Tuple[bool, str]:
         """Erstellt ein GitHub Issue - RESTORED FUNCTIONALITY"""
@@ -135,12 +235,18 @@ class GitHubAPI:
             data["labels"] = labels
         
         try:
-            response = requests.post(url, headers=self.headers, json=data)
-            if response.status_code == 201:
-                issue_data = response.json()
-                return True, f"Issue #{issue_data['number']} erstellt: {issue_data['html_url']}"
-            else:
-                return False, f"HTTP {response.status_code}: {response.text}"
+            for attempt in range(_GITHUB_RETRIES + 1):
+                response = self.session.post(url, headers=self.headers, json=data, timeout=_GITHUB_TIMEOUT)
+                if response.status_code == 201:
+                    issue_data = response.json()
+                    return True, f"Issue #{issue_data['number']} erstellt: {issue_data['html_url']}"
+                wait = _rate_limit_wait(response)
+                if wait is None:
+                    return False, f"HTTP {response.status_code}: {response.text}"
+                if attempt == _GITHUB_RETRIES or wait > _GITHUB_MAX_WAIT:
+                    break
+                time.sleep(wait)
+            return False, f"GitHub Rate-Limit (HTTP {response.status_code}), bitte in {int(wait)}s erneut versuchen"
         except Exception as e:
             return False, str(e)
 
@@ -148,54 +254,86 @@ class GitHubAPI:
 # TUI Navigation System (Enhanced v3.7.4.4)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@functools.lru_cache(maxsize=256)
+def _wrap_description(desc: str, width: int) -> Tuple[str, ...]:
+    """Umgebrochene Beschreibung – Beschreibungen sind statisch, Breite ändert sich selten"""
+    return tuple(textwrap.wrap(desc, width=width))
+
 def run_curses_menu(title: str, options: List[Tuple[str,str]], context: str="") -> Optional[int]:
     """Curses-basierte TUI mit Pfeiltasten-Navigation"""
+    import curses
+    def draw_option(stdscr, idx, selected):
+        if idx == selected:
+            stdscr.attron(curses.color_pair(1))
+            stdscr.addstr(3 + idx, 2, f"> {options[idx][0]}")
+            stdscr.attroff(curses.color_pair(1))
+        else:
+            stdscr.addstr(3 + idx, 2, f"  {options[idx][0]}")
+
+    def draw_description(stdscr, selected):
+        _, w = stdscr.getmaxyx()
+        dy, dx, bw = 3 + len(options) + 1, 2, w - 4
+        stdscr.addstr(dy + 1, dx + 2, " " * (bw - 4))
+        wrapped = _wrap_description(options[selected][1], bw - 4)
+        if wrapped:
+            stdscr.addstr(dy + 1, dx + 2, wrapped[0])
+
     def draw(stdscr, selected):
-        stdscr.clear()
+        """Kompletter Aufbau – nur beim Start, danach werden nur geänderte Zeilen neu gezeichnet"""
+        stdscr.erase()
         h, w = stdscr.getmaxyx()
         stdscr.addstr(0, 2, context, curses.A_DIM)
         stdscr.addstr(1, 2, title, curses.A_BOLD)
-        for idx, (opt, _) in enumerate(options):
-            x, y = 2, 3 + idx
-            if idx == selected:
-                stdscr.attron(curses.color_pair(1))
-                stdscr.addstr(y, x, f"> {opt}")
-                stdscr.attroff(curses.color_pair(1))
-            else:
-                stdscr.addstr(y, x, f"  {opt}")
+        for idx in range(len(options)):
+            draw_option(stdscr, idx, selected)
         
         dy, dx, bw = 3 + len(options) + 1, 2, w - 4
         stdscr.addstr(dy, dx, "┌" + "─" * (bw - 2) + "┐")
         stdscr.addstr(dy + 1, dx, "│ ")
         stdscr.addstr(dy + 1, dx + bw - 1, "│")
         stdscr.addstr(dy + 2, dx, "└" + "─" * (bw - 2) + "┘")
-        
-        desc = options[selected][1]
-        wrapped = textwrap.wrap(desc, width=bw - 4)
-        if wrapped:
-            stdscr.addstr(dy + 1, dx + 2, wrapped[0])
+        draw_description(stdscr, selected)
         
         stdscr.addstr(h - 2, 2, "Pfeiltasten: ↑↓ | Enter: OK | Q: Zurück", curses.A_DIM)
-        stdscr.refresh()
 
     def loop(stdscr):
         curses.curs_set(0)
         curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_WHITE)
         sel = 0
+        draw(stdscr, sel)
+        dirty = True  # Nur ausgeben, wenn sich wirklich etwas geändert hat
         while True:
-            draw(stdscr, sel)
+            if dirty:
+                stdscr.noutrefresh()
+                curses.doupdate()
+                dirty = False
             k = stdscr.getch()
+            prev = sel
             if k == curses.KEY_UP and sel > 0:
                 sel -= 1
             elif k == curses.KEY_DOWN and sel < len(options) - 1:
                 sel += 1
+            elif k == curses.KEY_RESIZE:
+                draw(stdscr, sel)
+                dirty = True
             elif k == ord('q'):
                 return None
             elif k in (curses.KEY_ENTER, 10, 13):
                 return sel
+            if sel != prev:
+                draw_option(stdscr, prev, sel)
+                draw_option(stdscr, sel, sel)
+                draw_description(stdscr, sel)
+                dirty = True
 
     return curses.wrapper(loop)
 
+def _pause(prompt: str = "Drücke Enter...") -> None:
+    """Wartet auf Enter – liest direkt von stdin, ohne readline-Zeileneditor wie bei input()"""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    sys.stdin.readline()
+
 def _execute_and_display(title: str, func: Callable, *args):
     """Führt Funktion aus und zeigt Ergebnis an"""
     console.clear()
@@ -206,7 +344,7 @@ def _execute_and_display(title: str, func: Callable, *args):
         console.print(res or "[green]✓ Erfolgreich[/green]")
     else:
         console.print(f"[bold red]Fehler:[/]\n{res}")
-    input("\nDrücke Enter zum Fortfahren...")
+    _pause("\nDrücke Enter zum Fortfahren...")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # AI-Powered Roadmap Generation (RESTORED v3.7.4.4)
@@ -220,13 +358,12 @@ def tui_generate_roadmap(repo_path: Path):
     readme = repo_path / "README.md"
     if not readme.exists():
         console.print(f"[red]❌ Keine README.md in {repo_path} gefunden![/red]")
-        input("Drücke Enter, um zurückzugehen…")
+        _pause("Drücke Enter, um zurückzugehen…")
         return
     
-    with open(readme, "r", encoding="utf-8") as f:
-        full_text = f.read()
+    size = readme.stat().st_size
+    full_text = readme.read_text(encoding="utf-8")
     
-    size = len(full_text.encode("utf-8"))
     console.print(f"[green]✓ README.md gefunden ({size} Bytes)[/green]")
     
     user = get_active_user()
@@ -235,7 +372,7 @@ def tui_generate_roadmap(repo_path: Path):
     if not token:
         console.print("[red]❌ OpenRouter Token nicht konfiguriert![/red]")
         console.print("Nutze: grepo2 configure")
-        input("Drücke Enter, um zurückzugehen…")
+        _pause("Drücke Enter, um zurückzugehen…")
         return
 
     system = (
@@ -268,7 +405,7 @@ def tui_generate_roadmap(repo_path: Path):
     }
 
     payload = {
-        "model": ucfg.get("model", "openai/gpt-3.5-turbo"),
+        "model": ucfg.get("model", _MODELS[0]),
         "messages": [
             {"role": "system", "content": system},
             {"role": "user", "content": api_user_msg}
@@ -277,90 +414,93 @@ def tui_generate_roadmap(repo_path: Path):
     }
     
     url = "https://openrouter.ai/api/v1/chat/completions"
-    content = ""
+    out = repo_path / "roadmap.md"
+    # Tokens direkt in eine Temp-Datei streamen; roadmap.md wird erst bei Erfolg ersetzt
+    tmp = out.with_name(out.name + ".tmp")
+    # Spinner bis zum ersten Token – das Modell braucht oft einige Sekunden bis zur ersten Ausgabe
+    waiting = console.status("[yellow]Warte auf erste Tokens...[/yellow]")
+    waiting.start()
     
     try:
-        with requests.post(url, headers=headers, json=payload, stream=True, timeout=120) as resp:
-            resp.encoding = 'utf-8'
+        with _http().post(url, headers=headers, json=payload, stream=True, timeout=120) as resp, \
+                open(tmp, "w", encoding="utf-8") as f_out:
             console.print(f"[blue]Antwort: HTTP {resp.status_code}[/blue]")
             resp.raise_for_status()
             
-            buffer = ""
-            for chunk in resp.iter_content(chunk_size=1024, decode_unicode=True):
-                buffer += chunk
-                while True:
-                    idx = buffer.find("\n")
-                    if idx == -1:
-                        break
-                    line = buffer[:idx].strip()
-                    buffer = buffer[idx+1:]
-                    
-                    if not line.startswith("data:"):
-                        continue
-                    data = line[len("data:"):].strip()
-                    if data == "[DONE]":
-                        break
-                    try:
-                        obj = json.loads(data)
-                        delta = obj["choices"][0]["delta"].get("content")
-                        if delta:
-                            print(delta, end="", flush=True)
-                            content += delta
-                    except json.JSONDecodeError:
-                        continue
+            # Rohe Bytes pro Zeile – der JSON-Parser dekodiert UTF-8 selbst, kein Codec pro Chunk
+            for line in resp.iter_lines(chunk_size=4096):
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    break
+                try:
+                    obj = _loads(data)
+                    delta = obj["choices"][0]["delta"].get("content")
+                    if delta:
+                        waiting.stop()
+                        print(delta, end="", flush=True)
+                        f_out.write(delta)
+                except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
+                    continue
             print()
             
     except Exception as e:
+        waiting.stop()
+        tmp.unlink(missing_ok=True)
         console.print(f"[red]Fehler beim Generieren der Roadmap: {e}[/red]")
-        input("Drücke Enter…")
+        _pause("Drücke Enter…")
         return
+    waiting.stop()
 
-    out = repo_path / "roadmap.md"
     try:
-        with open(out, "w", encoding="utf-8") as f:
-            f.write(content)
+        os.replace(tmp, out)
         console.print(f"[green]✅ roadmap.md erstellt: {out}[/green]")
         write_to_changelog(f"Roadmap generiert: {out.name}", "success")
     except Exception as e:
         console.print(f"[red]Fehler beim Speichern: {e}[/red]")
-    input("Drücke Enter...")
+    _pause("Drücke Enter...")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # GitHub Project Setup (RESTORED v3.7.4.4)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Phasen-Überschrift ("PHASE X – Titel") oder offene Aufgabe ("[ ] Kurztitel: Beschreibung")
+_ROADMAP_RE = re.compile(r"(PHASE.*)|\s*\[ \]\s*([^:]+):(.*)")
+
+def _parse_roadmap(roadmap: Path):
+    """Liest roadmap.md zeilenweise und liefert pro '[ ] Titel: Beschreibung' ein Issue-Dict"""
+    current_phase = ""
+    match = _ROADMAP_RE.match
+    with open(roadmap, "r", encoding="utf-8") as f:
+        for line in f:
+            m = match(line)
+            if m is None:
+                continue
+            phase, title, desc = m.groups()
+            if phase:
+                current_phase = phase.strip()
+            else:
+                yield {
+                    "title": title.strip(),
+                    "body": f"**Phase:** {current_phase}\n\n{desc.strip()}",
+                    "labels": ["roadmap", "enhancement"]
+                }
+
 def tui_setup_github_project(repo_path: Path):
     """GitHub Issues aus roadmap.md erstellen - RESTORED FUNCTIONALITY"""
     roadmap = repo_path / "roadmap.md"
     if not roadmap.exists():
         console.print(f"[red]❌ roadmap.md nicht gefunden in {repo_path}[/red]")
-        input("Drücke Enter...")
+        _pause("Drücke Enter...")
         return
     
-    with open(roadmap, "r", encoding="utf-8") as f:
-        content = f.read()
-    
     console.clear()
     console.rule(f"[bold cyan]🚀 GitHub Issues für: {repo_path.name}")
-    console.print(f"[green]✓ roadmap.md gefunden ({len(content)} Zeichen)[/green]")
+    console.print(f"[green]✓ roadmap.md gefunden ({roadmap.stat().st_size} Bytes)[/green]")
     
     # Parse Roadmap für Issues
-    lines = content.split("\n")
-    current_phase = ""
-    issues = []
-    
-    for line in lines:
-        if line.startswith("PHASE"):
-            current_phase = line.strip()
-        elif line.strip().startswith("[ ]"):
-            task = line.strip()[3:].strip()
-            if ":" in task:
-                title, desc = task.split(":", 1)
-                issues.append({
-                    "title": title.strip(),
-                    "body": f"**Phase:** {current_phase}\n\n{desc.strip()}",
-                    "labels": ["roadmap", "enhancement"]
-                })
+    issues = list(_parse_roadmap(roadmap))
     
     console.print(f"[cyan]📋 Gefundene Tasks: {len(issues)}[/cyan]")
     for i, issue in enumerate(issues[:3]):
@@ -370,7 +510,7 @@ def tui_setup_github_project(repo_path: Path):
     
     if not issues:
         console.print("[yellow]Keine Tasks gefunden[/yellow]")
-        input()
+        _pause("")
         return
     
     if input("\nIssues erstellen? (j/n): ").lower() != 'j':
@@ -384,7 +524,7 @@ def tui_setup_github_project(repo_path: Path):
     if not github_token:
         console.print("[red]❌ GitHub Token nicht konfiguriert![/red]")
         console.print("Nutze: grepo2 configure")
-        input()
+        _pause("")
         return
     
     github_api = GitHubAPI(github_token)
@@ -406,45 +546,38 @@ def tui_setup_github_project(repo_path: Path):
     created = 0
     failed = 0
     
-    with console.status("Erstelle GitHub Issues..."):
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
+    errors = []
+    progress = Progress(SpinnerColumn(), TextColumn("{task.description}"), BarColumn(),
+                        MofNCompleteColumn(), console=console._get())
+    # Nacheinander in Roadmap-Reihenfolge: Issue-Nummern folgen der Roadmap, und parallele
+    # Schreibzugriffe würden GitHubs sekundäres Rate-Limit auslösen
+    with progress:
+        task = progress.add_task("Erstelle GitHub Issues...", total=len(issues))
         for issue in issues:
             success, result = github_api.create_issue(full_repo, issue["title"], issue["body"], issue["labels"])
             if success:
                 created += 1
-                console.print(f"[green]✅ Issue erstellt: {issue['title'][:50]}...[/green]")
             else:
                 failed += 1
-                console.print(f"[red]❌ Fehler bei Issue '{issue['title'][:30]}...': {result}[/red]")
+                errors.append((issue["title"], result))
+            progress.update(task, advance=1, description=f"✅ {created} / ❌ {failed}")
+    
+    # Fehler gesammelt nach dem Fortschrittsbalken ausgeben
+    for title, result in errors:
+        console.print(f"[red]❌ Fehler bei Issue '{title[:30]}...': {result}[/red]")
     
     console.print(f"\n[green]✅ {created}/{len(issues)} Issues erstellt ({failed} Fehler)[/green]")
     if created > 0:
         write_to_changelog(f"GitHub Issues erstellt: {created} Issues für {repo_name}", "success")
-    input("Drücke Enter...")
+    _pause("Drücke Enter...")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Enhanced Project Creation (v3.7.4.4)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def create_local_project(project_path: Path) -> Tuple[bool, str]:
-    """Erstellt ein neues lokales Git-Projekt mit README Template"""
-    try:
-        if project_path.exists():
-            return False, f"Pfad {project_path} existiert bereits"
-        
-        project_path.mkdir(parents=True)
-        
-        # Git Repository initialisieren
-        result = subprocess.run(
-            ["git", "init"],
-            cwd=project_path,
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            return False, f"Git init fehlgeschlagen: {result.stderr}"
-        
-        # README.md Template erstellen
-        readme_content = f"""# {project_path.name}
+# README-Vorlage (Lastenpflichtenheft) für neue Projekte, {name} = Projektname
+_README_TEMPLATE = """# {name}
 
 ## 🎯 Übersicht
 Eine kurze, aber prägnante Beschreibung des Projekts und seines Hauptzwecks.
@@ -464,8 +597,8 @@ Eine kurze, aber prägnante Beschreibung des Projekts und seines Hauptzwecks.
 ### Setup
 ```bash
 # Repository klonen
-git clone https://github.com/username/{project_path.name}.git
-cd {project_path.name}
+git clone https://github.com/username/{name}.git
+cd {name}
 
 # Abhängigkeiten installieren
 # [Installations-Anweisungen hier einfügen]
@@ -510,7 +643,7 @@ command --help
 
 ## 📁 Projektstruktur
 ```
-{project_path.name}/
+{name}/
 ├── src/                    # Hauptquellcode
 │   ├── core/              # Kernfunktionalität
 │   ├── utils/             # Hilfsfunktionen
@@ -638,24 +771,42 @@ Dieses Projekt ist unter der [MIT License](LICENSE) lizenziert.
 
 ## 📞 Support & Kontakt
 
-- **Issues**: [GitHub Issues](https://github.com/username/{project_path.name}/issues)
-- **Discussions**: [GitHub Discussions](https://github.com/username/{project_path.name}/discussions)
-- **Email**: support@{project_path.name}.com
-- **Documentation**: [docs.{project_path.name}.com](https://docs.{project_path.name}.com)
+- **Issues**: [GitHub Issues](https://github.com/username/{name}/issues)
+- **Discussions**: [GitHub Discussions](https://github.com/username/{name}/discussions)
+- **Email**: support@{name}.com
+- **Documentation**: [docs.{name}.com](https://docs.{name}.com)
 
 ---
 
 **Hinweis**: Diese README.md dient als Lastenpflichtenheft für die automatische Roadmap-Generierung. 
 Jede hier beschriebene Funktionalität wird in der technischen Roadmap in implementierbare Aufgaben aufgeteilt.
 """
+
+def create_local_project(project_path: Path) -> Tuple[bool, str]:
+    """Erstellt ein neues lokales Git-Projekt mit README Template"""
+    try:
+        if project_path.exists():
+            return False, f"Pfad {project_path} existiert bereits"
+        
+        project_path.mkdir(parents=True)
+        
+        # README.md Template erstellen
+        readme_content = _README_TEMPLATE.format(name=project_path.name)
         
         readme_path = project_path / "README.md"
-        with open(readme_path, "w", encoding="utf-8") as f:
-            f.write(readme_content)
+        readme_path.write_text(readme_content, encoding="utf-8")
         
-        # Erste Git Commits
-        subprocess.run(["git", "add", "README.md"], cwd=project_path)
-        subprocess.run(["git", "commit", "-m", "🎉 Initial commit: Add comprehensive README.md"], cwd=project_path)
+        # Git init + erster Commit in einem Prozess; Exit-Code 2 = init fehlgeschlagen,
+        # ein fehlgeschlagener Commit (z.B. ohne user.email) bricht wie bisher nicht ab
+        result = subprocess.run(
+            ["sh", "-c", 'git init || exit 2; git add README.md && git commit -m "$1"',
+             "sh", "🎉 Initial commit: Add comprehensive README.md"],
+            cwd=project_path,
+            capture_output=True,
+            text=True
+        )
+        if result.returncode == 2:
+            return False, f"Git init fehlgeschlagen: {result.stderr}"
         
         write_to_changelog(f"Neues Projekt erstellt: {project_path.name}", "success")
         return True, f"Projekt erfolgreich erstellt: {project_path}"
@@ -663,6 +814,20 @@ Jede hier beschriebene Funktionalität wird in der technischen Roadmap in implem
     except Exception as e:
         return False, str(e)
 
+def _scan_project_dirs(root: Path) -> List[Tuple[Path, bool, bool]]:
+    """Ein os.scandir-Durchlauf: (Pfad, hat .git, hat roadmap.md) für jedes Unterverzeichnis"""
+    found = []
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir():
+                path = Path(entry.path)
+                has_git = (path / ".git").exists()
+                has_roadmap = (path / "roadmap.md").exists()
+                if has_git or has_roadmap:
+                    found.append((path, has_git, has_roadmap))
+    found.sort(key=lambda t: t[0].name)
+    return found
+
 def tui_projekterstellung_menu():
     """Erweiterte Projekterstellung mit Roadmap & GitHub Integration"""
     context = "🚀 Vollständiger Projekt-Setup-Prozess mit KI-Integration"
@@ -685,10 +850,10 @@ def tui_projekterstellung_menu():
                 _execute_and_display("Projekt erstellen", lambda: create_local_project(path))
                 
         elif choice == 1:  # Roadmap generieren
-            dirs = [d for d in Path.cwd().iterdir() if d.is_dir() and (d / ".git").exists()]
+            dirs = [d for d, has_git, _ in _scan_project_dirs(Path.cwd()) if has_git]
             if not dirs:
                 console.print("[yellow]Keine Git-Repositories gefunden[/yellow]")
-                input()
+                _pause("")
                 continue
             
             console.print("🗂️ Verfügbare Repositories:")
@@ -701,13 +866,13 @@ def tui_projekterstellung_menu():
                     tui_generate_roadmap(dirs[idx])
             except (ValueError, IndexError):
                 console.print("[red]Ungültige Auswahl[/red]")
-                input()
+                _pause("")
                 
         elif choice == 2:  # GitHub Issues
-            dirs = [d for d in Path.cwd().iterdir() if d.is_dir() and (d / "roadmap.md").exists()]
+            dirs = [d for d, _, has_roadmap in _scan_project_dirs(Path.cwd()) if has_roadmap]
             if not dirs:
                 console.print("[yellow]Keine Repositories mit roadmap.md gefunden[/yellow]")
-                input()
+                _pause("")
                 continue
             
             console.print("🗂️ Repositories mit Roadmap:")
@@ -720,7 +885,7 @@ def tui_projekterstellung_menu():
                     tui_setup_github_project(dirs[idx])
             except (ValueError, IndexError):
                 console.print("[red]Ungültige Auswahl[/red]")
-                input()
+                _pause("")
                 
         elif choice == 3:  # Vollständiger Setup
             name = input("📁 Projektname für vollständigen Setup: ").strip()
@@ -734,7 +899,7 @@ def tui_projekterstellung_menu():
                 success, result = create_local_project(path)
                 if not success:
                     console.print(f"[red]❌ Fehler: {result}[/red]")
-                    input()
+                    _pause("")
                     continue
                 console.print("[green]✅ Projekt erstellt[/green]")
                 
@@ -743,7 +908,7 @@ def tui_projekterstellung_menu():
                 console.print(f"\n🔹 Schritt 2/4: README.md anpassen...")
                 console.print(f"📝 Datei: {readme_path}")
                 console.print("💡 Tipp: Beschreibe dein Projekt detailliert für bessere Roadmap-Generierung")
-                input("📝 Bearbeite die README.md und drücke Enter wenn fertig...")
+                _pause("📝 Bearbeite die README.md und drücke Enter wenn fertig...")
                 
                 # Schritt 3: Roadmap generieren
                 console.print("\n🔹 Schritt 3/4: KI Roadmap generieren...")
@@ -759,7 +924,7 @@ def tui_projekterstellung_menu():
                 console.print(f"📋 README.md: {path / 'README.md'}")
                 console.print(f"🗺️ Roadmap: {path / 'roadmap.md'}")
                 write_to_changelog(f"Vollständiger Projekt-Setup: {name}", "success")
-                input("Drücke Enter...")
+                _pause("Drücke Enter...")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Main Application (v3.7.4.4)
@@ -790,6 +955,51 @@ def tui_main_menu():
         elif choice == 3:  # Hilfe
             tui_show_help()
 
+def _set_field(user: str, ucfg: Dict, key: str, prompt: str, label: str) -> Optional[str]:
+    """Liest einen Wert ein und setzt ucfg[key], falls nicht leer"""
+    value = input(prompt).strip()
+    if value:
+        ucfg[key] = value
+        return f"✅ {label} gespeichert"
+    return None
+
+def _cfg_pick_model(user: str, ucfg: Dict) -> Optional[str]:
+    console.print("🤖 Verfügbare Modelle:")
+    for i, model in enumerate(_MODELS, 1):
+        console.print(f"  {i}. {model}")
+    try:
+        idx = int(input("Modell wählen (Nummer): ")) - 1
+        if 0 <= idx < _MODEL_COUNT:
+            ucfg['model'] = _MODELS[idx]
+            return f"✅ Modell gesetzt: {_MODELS[idx]}"
+    except (ValueError, IndexError):
+        console.print("[red]Ungültige Auswahl[/red]")
+    return None
+
+def _cfg_show(user: str, ucfg: Dict) -> Optional[str]:
+    from rich.table import Table
+    console.clear()
+    console.rule("⚙️ Aktuelle Konfiguration")
+    table = Table()
+    table.add_column("Setting")
+    table.add_column("Value")
+    table.add_row("User", user)
+    table.add_row("GitHub Token", "✅ Gesetzt" if ucfg.get('github_token') else "❌ Nicht gesetzt")
+    table.add_row("OpenRouter Token", "✅ Gesetzt" if ucfg.get('openrouter_token') else "❌ Nicht gesetzt")
+    table.add_row("GitHub Username", ucfg.get('github_username', '❌ Nicht gesetzt'))
+    table.add_row("KI-Modell", ucfg.get('model', _MODELS[0]))
+    console.print(table)
+    return None
+
+# Menüindex → Handler; ein Handler liefert die Erfolgsmeldung, wenn ucfg geändert wurde und gespeichert werden soll
+_CFG_HANDLERS: Dict[int, Callable[[str, Dict], Optional[str]]] = {
+    0: functools.partial(_set_field, key='github_token', prompt="🔐 GitHub Personal Access Token: ", label="GitHub Token"),
+    1: functools.partial(_set_field, key='openrouter_token', prompt="🤖 OpenRouter API Token: ", label="OpenRouter Token"),
+    2: functools.partial(_set_field, key='github_username', prompt="👤 GitHub Username: ", label="GitHub Username"),
+    3: _cfg_pick_model,
+    4: _cfg_show,
+}
+
 def tui_configuration_menu():
     """Konfigurationsmenü"""
     user = get_active_user()
@@ -807,107 +1017,75 @@ def tui_configuration_menu():
     
     while True:
         choice = run_curses_menu("⚙️ Konfiguration", menu_options, context)
-        if choice is None or choice == 5:
+        handler = _CFG_HANDLERS.get(choice)
+        if handler is None:  # Zurück / q
             break
-        elif choice == 0:  # GitHub Token
-            token = input("🔐 GitHub Personal Access Token: ").strip()
-            if token:
-                ucfg['github_token'] = token
-                save_user_config(user, ucfg)
-                console.print("[green]✅ GitHub Token gespeichert[/green]")
-        elif choice == 1:  # OpenRouter Token
-            token = input("🤖 OpenRouter API Token: ").strip()
-            if token:
-                ucfg['openrouter_token'] = token
-                save_user_config(user, ucfg)
-                console.print("[green]✅ OpenRouter Token gespeichert[/green]")
-        elif choice == 2:  # GitHub Username
-            username = input("👤 GitHub Username: ").strip()
-            if username:
-                ucfg['github_username'] = username
-                save_user_config(user, ucfg)
-                console.print("[green]✅ GitHub Username gespeichert[/green]")
-        elif choice == 3:  # KI-Modell
-            models = ["openai/gpt-3.5-turbo", "openai/gpt-4", "anthropic/claude-3-haiku", "google/gemini-pro"]
-            console.print("🤖 Verfügbare Modelle:")
-            for i, model in enumerate(models):
-                console.print(f"  {i+1}. {model}")
-            try:
-                idx = int(input("Modell wählen (Nummer): ")) - 1
-                if 0 <= idx < len(models):
-                    ucfg['model'] = models[idx]
-                    save_user_config(user, ucfg)
-                    console.print(f"[green]✅ Modell gesetzt: {models[idx]}[/green]")
-            except (ValueError, IndexError):
-                console.print("[red]Ungültige Auswahl[/red]")
-        elif choice == 4:  # Konfiguration anzeigen
-            console.clear()
-            console.rule("⚙️ Aktuelle Konfiguration")
-            table = Table()
-            table.add_column("Setting")
-            table.add_column("Value")
-            table.add_row("User", user)
-            table.add_row("GitHub Token", "✅ Gesetzt" if ucfg.get('github_token') else "❌ Nicht gesetzt")
-            table.add_row("OpenRouter Token", "✅ Gesetzt" if ucfg.get('openrouter_token') else "❌ Nicht gesetzt")
-            table.add_row("GitHub Username", ucfg.get('github_username', '❌ Nicht gesetzt'))
-            table.add_row("KI-Modell", ucfg.get('model', 'openai/gpt-3.5-turbo'))
-            console.print(table)
-        input("Drücke Enter...")
+        message = handler(user, ucfg)
+        if message:
+            save_user_config(user, ucfg)
+            console.print(f"[green]{message}[/green]")
+        _pause("Drücke Enter...")
+
+@functools.lru_cache(maxsize=None)
+def _probe(cmd: Tuple[str, ...]) -> Tuple[int, str]:
+    """Führt eine Versionsabfrage einmal pro Prozess aus und liefert (Returncode, stdout)
+
+    Nur lesende `--version`-Aufrufe sind erlaubt, damit das Caching nie
+    einen Befehl mit Seiteneffekten verschluckt.
+    """
+    if cmd[-1:] != ("--version",):
+        raise ValueError(f"Nur --version-Abfragen erlaubt: {cmd}")
+    try:
+        result = subprocess.run(list(cmd), capture_output=True, text=True, check=False, timeout=2.0)
+    except (OSError, subprocess.SubprocessError):  # nicht installiert oder Timeout
+        return 127, ""
+    return result.returncode, result.stdout.strip()
+
+_STATUS_COLUMNS = ("Component", "Status", "Details")
+_STATUS_VERSION_ROW = ("🌟 GREPO2", "✅ v3.7.4.4", "Vollständig funktional")
+_FUNC_LABELS = ("🚀 Projekt erstellen", "🤖 Roadmap generieren", "📋 GitHub Issues",
+                "📝 CHANGELOG Integration", "⚙️ Konfiguration")
+_TOKEN_STATUS = ("⚠️ Token erforderlich", "✅ Wiederhergestellt")
 
 def tui_show_status():
     """System-Status anzeigen"""
+    from rich.table import Table
     console.clear()
     console.rule("📋 System Status")
     
     user = get_active_user()
     ucfg = load_user_config(user) or {}
-    
-    # Status-Tabelle
-    table = Table()
-    table.add_column("Component")
-    table.add_column("Status")
-    table.add_column("Details")
-    
-    table.add_row("🌟 GREPO2", "✅ v3.7.4.4", "Vollständig funktional")
-    table.add_row("👤 User", "✅ Aktiv", user)
-    table.add_row("🔐 GitHub Token", "✅ OK" if ucfg.get('github_token') else "❌ Fehlt", "Für Issue-Erstellung")
-    table.add_row("🤖 OpenRouter Token", "✅ OK" if ucfg.get('openrouter_token') else "❌ Fehlt", "Für KI-Roadmap")
-    table.add_row("📁 Working Dir", "✅ OK", str(Path.cwd()))
+    has_gh = bool(ucfg.get('github_token'))
+    has_or = bool(ucfg.get('openrouter_token'))
     
     # Git-Status prüfen
-    try:
-        result = subprocess.run(["git", "--version"], capture_output=True, text=True)
-        git_status = "✅ OK" if result.returncode == 0 else "❌ Fehlt"
-        git_version = result.stdout.strip() if result.returncode == 0 else "Nicht installiert"
-    except:
-        git_status = "❌ Fehlt"
-        git_version = "Nicht installiert"
+    rc, out = _probe(("git", "--version"))
+    git_status = "✅ OK" if rc == 0 else "❌ Fehlt"
+    git_version = out if rc == 0 else "Nicht installiert"
     
-    table.add_row("🔧 Git", git_status, git_version)
+    # Status-Tabelle: Spalten und statische Zeile vorberechnet, nur die Statuszellen sind dynamisch
+    table = Table(*_STATUS_COLUMNS)
+    for row in (
+        _STATUS_VERSION_ROW,
+        ("👤 User", "✅ Aktiv", user),
+        ("🔐 GitHub Token", "✅ OK" if has_gh else "❌ Fehlt", "Für Issue-Erstellung"),
+        ("🤖 OpenRouter Token", "✅ OK" if has_or else "❌ Fehlt", "Für KI-Roadmap"),
+        ("📁 Working Dir", "✅ OK", str(Path.cwd())),
+        ("🔧 Git", git_status, git_version),
+    ):
+        table.add_row(*row)
     
     console.print(table)
     
     # Funktions-Status
     console.print("\n📋 Verfügbare Funktionen:")
-    functions = [
-        ("🚀 Projekt erstellen", "✅ Verfügbar"),
-        ("🤖 Roadmap generieren", "✅ Wiederhergestellt" if ucfg.get('openrouter_token') else "⚠️ Token erforderlich"),
-        ("📋 GitHub Issues", "✅ Wiederhergestellt" if ucfg.get('github_token') else "⚠️ Token erforderlich"),
-        ("📝 CHANGELOG Integration", "✅ Verfügbar"),
-        ("⚙️ Konfiguration", "✅ Verfügbar")
-    ]
-    
-    for func, status in functions:
+    statuses = ("✅ Verfügbar", _TOKEN_STATUS[has_or], _TOKEN_STATUS[has_gh], "✅ Verfügbar", "✅ Verfügbar")
+    for func, status in zip(_FUNC_LABELS, statuses):
         console.print(f"  {func}: {status}")
     
-    input("\nDrücke Enter...")
+    _pause("\nDrücke Enter...")
 
-def tui_show_help():
-    """Hilfe und Dokumentation anzeigen"""
-    console.clear()
-    console.rule("📖 GREPO2 v3.7.4.4 Hilfe")
-    
-    help_text = """
+_HELP_TEXT = """
 🌟 GREPO2 v3.7.4.4 - Git Repository Manager mit KI-Integration
 
 📋 HAUPTFUNKTIONEN:
@@ -945,7 +1123,7 @@ def tui_show_help():
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 1. Abhängigkeiten installieren:
-   pip install click requests rich
+   pip install requests rich
 
 2. Konfiguration:
    • GitHub Personal Access Token generieren (repo, issues)
@@ -985,21 +1163,23 @@ def tui_show_help():
 
 Entwickelt von Dennis (2024) - v3.7.4.4 COMPLETE RESTORED
 """
-    
-    console.print(help_text)
-    input("\nDrücke Enter...")
+
+@functools.lru_cache(maxsize=1)
+def _help_renderable():
+    """Hilfetext einmal pro Prozess in ein rich-Text-Objekt umwandeln (Markup, Emoji, Highlighting)"""
+    return console.render_str(_HELP_TEXT)
+
+def tui_show_help():
+    """Hilfe und Dokumentation anzeigen"""
+    console.clear()
+    console.rule("📖 GREPO2 v3.7.4.4 Hilfe")
+    console.print(_help_renderable())
+    _pause("\nDrücke Enter...")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CLI Interface (v3.7.4.4)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@click.group()
-@click.version_option(version="3.7.4.4", prog_name="grepo2")
-def cli():
-    """🌟 GREPO2 v3.7.4.4 - Git Repository Manager mit vollständig wiederhergestellten KI-Funktionen"""
-    pass
-
-@cli.command()
 def tui():
     """🖥️ Startet die TUI (Terminal User Interface)"""
     try:
@@ -1009,8 +1189,6 @@ def tui():
     except Exception as e:
         console.print(f"[red]❌ Fehler: {e}[/red]")
 
-@cli.command()
-@click.argument('project_name')
 def create(project_name):
     """🚀 Erstellt ein neues Projekt"""
     path = Path.cwd() / project_name
@@ -1020,27 +1198,56 @@ def create(project_name):
     else:
         console.print(f"[red]❌ {result}[/red]")
 
-@cli.command()
-@click.argument('repo_path', type=click.Path(exists=True))
 def roadmap(repo_path):
     """🤖 Generiert Roadmap für Repository"""
     tui_generate_roadmap(Path(repo_path))
 
-@cli.command()
-@click.argument('repo_path', type=click.Path(exists=True))
 def issues(repo_path):
     """📋 Erstellt GitHub Issues aus Roadmap"""
     tui_setup_github_project(Path(repo_path))
 
-@cli.command()
 def configure():
     """⚙️ Konfiguration verwalten"""
     tui_configuration_menu()
 
-@cli.command()
 def status():
     """📋 System-Status anzeigen"""
     tui_show_status()
 
+# Befehl → (Funktion, Argumentname, Pfad muss existieren)
+_COMMANDS = {
+    "tui": (tui, None, False),
+    "create": (create, "project_name", False),
+    "roadmap": (roadmap, "repo_path", True),
+    "issues": (issues, "repo_path", True),
+    "configure": (configure, None, False),
+    "status": (status, None, False),
+}
+
+def cli(argv: Optional[List[str]] = None):
+    """🌟 GREPO2 v3.7.4.4 - Git Repository Manager mit vollständig wiederhergestellten KI-Funktionen"""
+    # argparse statt click: stdlib, kein zusätzlicher Import beim Start
+    import argparse
+    parser = argparse.ArgumentParser(prog="grepo2", description=cli.__doc__)
+    parser.add_argument("--version", action="version", version="grepo2, version 3.7.4.4")
+    sub = parser.add_subparsers(dest="command", metavar="COMMAND")
+    for name, (func, arg, _) in _COMMANDS.items():
+        cmd = sub.add_parser(name, help=func.__doc__, description=func.__doc__)
+        if arg:
+            cmd.add_argument(arg, metavar=arg.upper())
+
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return
+    func, arg, must_exist = _COMMANDS[args.command]
+    if not arg:
+        func()
+        return
+    value = getattr(args, arg)
+    if must_exist and not Path(value).exists():
+        sub.choices[args.command].error(f"Pfad '{value}' existiert nicht.")
+    func(value)
+
 if __name__ == "__main__":
     cli()